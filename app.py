@@ -1,13 +1,36 @@
 # app.py – Global News & Politics Trending Dashboard
 import os
-import re
 from datetime import datetime, timezone
-from typing import List
 
 import pandas as pd
-import requests
 import streamlit as st
 
+from news_dashboard import (
+    EXTERNAL_COLLECTOR,
+    FETCH_ERRORS,
+    KEY_POOL,
+    MAX_TOTAL_RESULTS,
+    PREWARM_ENABLED,
+    QUOTA_LEDGER,
+    REFRESH_SCHEDULER,
+    REGION_CACHE,
+    REGION_FLIGHTS,
+    REGION_LABELS_BY_CODE,
+    QuotaBudgetExceeded,
+    breaker_stats,
+    configure_api_keys,
+    describe_error,
+    fetch_regions,
+    get_region_snapshot,
+    peek_region_snapshot,
+    read_region_snapshot,
+    refresh_region,
+    region_failure,
+    request_refresh,
+    start_background_worker,
+    top_videos_and_shorts,
+)
+
 # ----------------- STREAMLIT PAGE CONFIG -----------------
 st.set_page_config(
     page_title="Global News & Politics – Trending Dashboard",
@@ -16,15 +39,30 @@ st.set_page_config(
 )
 
 # ----------------- YOUTUBE API CONFIG --------------------
-API_KEY = st.secrets.get("YOUTUBE_API_KEY", None) or os.getenv("YOUTUBE_API_KEY")
-if not API_KEY:
+# A single key (YOUTUBE_API_KEY) or a pool (YOUTUBE_API_KEYS: list or "KEY_A:3,KEY_B")
+API_KEYS = (
+    st.secrets.get("YOUTUBE_API_KEYS", None)
+    or os.getenv("YOUTUBE_API_KEYS")
+    or st.secrets.get("YOUTUBE_API_KEY", None)
+    or os.getenv("YOUTUBE_API_KEY")
+)
+if not API_KEYS and not EXTERNAL_COLLECTOR:
     st.error(
-        "No YouTube API key found. Please set `YOUTUBE_API_KEY` in Streamlit **Secrets** "
-        "or as an environment variable."
+        "No YouTube API key found. Please set `YOUTUBE_API_KEY` (or a `YOUTUBE_API_KEYS` pool) "
+        "in Streamlit **Secrets** or as an environment variable."
     )
     st.stop()
-
-YOUTUBE_API_URL = "https://www.googleapis.com/youtube/v3"
+if API_KEYS:
+    configure_api_keys(API_KEYS)
+
+# Background worker that keeps every region warm; while it runs the UI only
+# reads cached snapshots and never waits on the network itself. With an
+# external collector (YOUTUBE_EXTERNAL_COLLECTOR=1) this process does not
+# fetch at all and only reads what the collector publishes to the store.
+WORKER = (
+    start_background_worker() if PREWARM_ENABLED and not EXTERNAL_COLLECTOR else None
+)
+READ_ONLY = EXTERNAL_COLLECTOR or WORKER is not None
 
 # Region choices for single-region dropdown
 REGION_CHOICES = {
@@ -41,44 +79,8 @@ REGION_CHOICES = {
     "Worldwide proxy (use US)": "US",
 }
 
-# Canonical label per region code (used in combined view)
-REGION_LABELS_BY_CODE = {
-    "US": "United States",
-    "CA": "Canada",
-    "GB": "United Kingdom",
-    "IN": "India",
-    "AU": "Australia",
-    "DE": "Germany",
-    "FR": "France",
-    "BR": "Brazil",
-    "JP": "Japan",
-    "MX": "Mexico",
-}
-
 # ----------------- UTILS ---------------------------------
 
-ISO_DURATION_RE = re.compile(
-    r"PT"                  # starts with PT
-    r"(?:(\d+)H)?"         # hours
-    r"(?:(\d+)M)?"         # minutes
-    r"(?:(\d+)S)?"         # seconds
-)
-
-
-def parse_iso_duration(s: str) -> int:
-    """Return duration in seconds from ISO-8601 string like 'PT3M12S'."""
-    if not s:
-        return 0
-    m = ISO_DURATION_RE.fullmatch(s)
-    if not m:
-        return 0
-    h, m_, s_ = m.groups()
-    h = int(h) if h else 0
-    m_ = int(m_) if m_ else 0
-    s_ = int(s_) if s_ else 0
-    return h * 3600 + m_ * 60 + s_
-
-
 def format_views(n: int) -> str:
     if n >= 1_000_000_000:
         return f"{n/1_000_000_000:.1f}B"
@@ -89,6 +91,14 @@ def format_views(n: int) -> str:
     return str(n)
 
 
+def format_age(sec: float) -> str:
+    if sec < 60:
+        return f"{int(sec)}s"
+    if sec < 3600:
+        return f"{int(sec // 60)} min"
+    return f"{sec / 3600:.1f} h"
+
+
 def format_duration_sec(sec: int) -> str:
     if not sec:
         return "–"
@@ -126,85 +136,6 @@ def time_ago(published_at: str) -> str:
         return ""
 
 
-# ----------------- YOUTUBE API CALL ----------------------
-
-def fetch_trending_news_for_region(
-    region_code: str, max_results: int = 50
-) -> pd.DataFrame:
-    """
-    Fetch trending *News & Politics* videos for a region and return a DataFrame.
-
-    Uses:
-    - chart=mostPopular
-    - videoCategoryId=25 (News & Politics)
-    """
-    params = {
-        "part": "snippet,statistics,contentDetails",
-        "chart": "mostPopular",
-        "regionCode": region_code,
-        "videoCategoryId": "25",
-        "maxResults": max_results,
-        "key": API_KEY,
-    }
-
-    resp = requests.get(f"{YOUTUBE_API_URL}/videos", params=params, timeout=15)
-    resp.raise_for_status()
-    data = resp.json()
-
-    videos: List[dict] = []
-
-    region_label = REGION_LABELS_BY_CODE.get(region_code, region_code)
-
-    for item in data.get("items", []):
-        vid = item.get("id")
-        snippet = item.get("snippet", {}) or {}
-        stats = item.get("statistics", {}) or {}
-        details = item.get("contentDetails", {}) or {}
-        thumbs = (snippet.get("thumbnails") or {}) or {}
-
-        # Pick a decent thumbnail
-        thumb_obj = (
-            thumbs.get("medium")
-            or thumbs.get("high")
-            or thumbs.get("standard")
-            or thumbs.get("default")
-            or {}
-        )
-        thumb_url = thumb_obj.get("url")
-
-        # Duration + Shorts detection
-        duration_sec = parse_iso_duration(details.get("duration", ""))
-        text = (snippet.get("title", "") + " " + snippet.get("description", "")).lower()
-        marked_as_shorts = "#shorts" in text or " #short " in text
-        is_short = marked_as_shorts or duration_sec <= 75
-
-        videos.append(
-            {
-                "region_code": region_code,
-                "region_label": region_label,
-                "video_id": vid,
-                "title": snippet.get("title", ""),
-                "description": snippet.get("description", "") or "",
-                "channel_title": snippet.get("channelTitle", "") or "",
-                "published_at": snippet.get("publishedAt", ""),
-                "view_count": int(stats.get("viewCount", 0)),
-                "like_count": int(stats.get("likeCount", 0)) if "likeCount" in stats else None,
-                "duration_sec": duration_sec,
-                "is_short": is_short,
-                "thumbnail_url": thumb_url,
-                "url": f"https://www.youtube.com/watch?v={vid}",
-            }
-        )
-
-    if not videos:
-        return pd.DataFrame()
-
-    df = pd.DataFrame(videos)
-    df.sort_values("view_count", ascending=False, inplace=True)
-    df.reset_index(drop=True, inplace=True)
-    return df
-
-
 # ----------------- CSS / CARD STYLE ---------------------
 
 CARD_CSS = """
@@ -340,6 +271,56 @@ def render_video_list(df: pd.DataFrame, section_key: str, show_region: bool = Fa
         st.markdown(card_html, unsafe_allow_html=True)
 
 
+def read_snapshot(region_code: str, max_results: int):
+    """Non-blocking snapshot read for the read-only modes (None while loading)."""
+    if EXTERNAL_COLLECTOR:
+        return read_region_snapshot(region_code, max_results)
+    return peek_region_snapshot(region_code, max_results)
+
+
+def read_failure(region_code: str, max_results: int):
+    """Error of the region's latest background fetch (None with an external collector)."""
+    if EXTERNAL_COLLECTOR:
+        return None
+    return region_failure(region_code, max_results)
+
+
+def render_debug_panel() -> None:
+    quota = QUOTA_LEDGER.snapshot()
+    with st.sidebar.expander("🛠 Debug – API quota & cache"):
+        st.metric(
+            "Budget remaining (units)",
+            f"{quota['remaining']:,} / {quota['budget']:,}",
+        )
+        st.metric("Refresh interval", format_age(REFRESH_SCHEDULER.refresh_interval()))
+        st.caption(f"Quota resets at {QUOTA_LEDGER.resets_at():%Y-%m-%d %H:%M %Z}.")
+        if EXTERNAL_COLLECTOR:
+            st.caption("Quota is spent by the external collector, not by this process.")
+        st.markdown("**API keys**")
+        st.dataframe(pd.DataFrame(KEY_POOL.status()), hide_index=True)
+        st.markdown("**Units spent today**")
+        st.json(
+            {
+                "by_key": quota["by_key"],
+                "by_region": quota["by_region"],
+                "by_hour": quota["by_hour"],
+            }
+        )
+        st.markdown("**Cache / coalescing / breakers / worker**")
+        st.json(
+            {
+                "cache": REGION_CACHE.stats(),
+                "single_flight": REGION_FLIGHTS.stats(),
+                "circuit_breakers": breaker_stats(),
+                "prewarm_worker": (
+                    WORKER.status() if WORKER is not None
+                    else "external collector" if EXTERNAL_COLLECTOR
+                    else "disabled"
+                ),
+            }
+        )
+
+
 # ----------------- MAIN APP --------------------------------
 
 def main():
@@ -361,19 +342,82 @@ def main():
         max_results = st.slider(
             "Max results from API",
             min_value=10,
-            max_value=50,
+            max_value=MAX_TOTAL_RESULTS,
             value=40,
             step=5,
         )
 
     region_code = REGION_CHOICES[region_label]
 
-    refresh = st.button("🔄 Refresh primary region data")
-
-    # Single-region data
-    df = fetch_trending_news_for_region(
-        region_code=region_code, max_results=max_results
-    )
+    # The external collector owns the refresh cadence; nothing to trigger here
+    refresh = False if EXTERNAL_COLLECTOR else st.button("🔄 Refresh primary region data")
+
+    render_debug_panel()
+
+    # Single-region data (served from the shared cache, stale-while-revalidate;
+    # the slider only slices the cached 50-video page, or the paginated set above 50)
+    if READ_ONLY:
+        if refresh:
+            # Refetch in the background; keep showing the cached copy meanwhile
+            request_refresh(region_code, max_results)
+        snapshot = read_snapshot(region_code, max_results)
+        failure = read_failure(region_code, max_results)
+        if snapshot is None and EXTERNAL_COLLECTOR:
+            st.info(
+                "No data published for this region yet. Make sure the collector "
+                "(`python -m news_dashboard collect`) is running, then rerun the page."
+            )
+            return
+        if snapshot is None and failure is not None:
+            st.error(
+                f"Could not fetch this region ({format_age(failure.age_sec)} ago) and no "
+                f"cached data is available: {describe_error(failure.error)}. "
+                "It will be retried in the background."
+            )
+            return
+        if snapshot is None:
+            st.info(
+                "Data for this region is being fetched in the background. "
+                "Rerun the page in a moment."
+            )
+            return
+        if failure is not None:
+            st.warning(
+                f"The latest refresh failed {format_age(failure.age_sec)} ago: "
+                f"{describe_error(failure.error)}. Showing the last cached data."
+            )
+    else:
+        snapshot = None
+        try:
+            if refresh:
+                # Refetch only this region; the cached copy stays until a new one replaces it
+                try:
+                    refresh_region(region_code, max_results)
+                except FETCH_ERRORS as exc:
+                    # Non-blocking read: the failed region is in its retry cooldown
+                    snapshot = peek_region_snapshot(region_code, max_results)
+                    if snapshot is None:
+                        raise
+                    st.warning(
+                        f"Refresh failed: {describe_error(exc)}. Showing the last cached data."
+                    )
+            if snapshot is None:
+                snapshot = get_region_snapshot(
+                    region_code=region_code, max_results=max_results
+                )
+        except QuotaBudgetExceeded as exc:
+            st.error(
+                "API quota budget exhausted and no cached data for this region. "
+                f"{describe_error(exc)}"
+            )
+            return
+        except FETCH_ERRORS as exc:
+            st.error(
+                "Could not reach the YouTube API and no cached data for this region: "
+                f"{describe_error(exc)}"
+            )
+            return
+    df = snapshot.df
 
     if df.empty:
         st.warning("No videos returned from the API for this region.")
@@ -389,6 +433,10 @@ def main():
         f"**Fetched {len(df)} News & Politics videos** for region "
         f"`{region_code}` ({region_label})."
     )
+    age_note = f"Data fetched {format_age(snapshot.age_sec)} ago"
+    if snapshot.age_sec > REFRESH_SCHEDULER.refresh_interval() and not EXTERNAL_COLLECTOR:
+        age_note += " · refreshing in the background, rerun to see new data"
+    st.caption(age_note)
 
     tabs = st.tabs(
         ["Regular videos", "Shorts", "Combined regions", "Raw table"]
@@ -469,10 +517,34 @@ def main():
             )
 
             combined_dfs = []
-            for code in combined_codes:
-                df_region = fetch_trending_news_for_region(code, max_results)
-                if not df_region.empty:
-                    combined_dfs.append(df_region)
+            if READ_ONLY:
+                # Use whatever the worker / collector has published so far
+                loading = []
+                for code in combined_codes:
+                    label = REGION_LABELS_BY_CODE.get(code, code)
+                    snap = read_snapshot(code, max_results)
+                    failure = read_failure(code, max_results)
+                    if failure is not None:
+                        st.warning(
+                            f"Could not fetch {label}: {describe_error(failure.error)}"
+                            + (" (showing the last cached data)" if snap is not None else "")
+                        )
+                    if snap is None:
+                        if failure is None:
+                            loading.append(label)
+                    elif not snap.df.empty:
+                        combined_dfs.append(snap.df)
+                if loading:
+                    st.info(f"Still loading in the background: {', '.join(loading)}.")
+            else:
+                # Fetch all selected regions concurrently; failures are reported per region
+                results = fetch_regions(combined_codes, max_results=max_results)
+                for code, result in results.items():
+                    if not result.ok:
+                        label = REGION_LABELS_BY_CODE.get(code, code)
+                        st.warning(f"Could not fetch {label}: {describe_error(result.error)}")
+                    elif not result.df.empty:
+                        combined_dfs.append(result.df)
 
             if not combined_dfs:
                 st.info(
@@ -480,26 +552,19 @@ def main():
                     "Try adjusting the selection and pressing GO again."
                 )
             else:
-                df_combined = pd.concat(combined_dfs, ignore_index=True)
-                df_combined.sort_values("view_count", ascending=False, inplace=True)
-                df_combined.reset_index(drop=True, inplace=True)
-
-                # Ensure is_short column exists
-                if "is_short" not in df_combined.columns:
-                    df_combined["is_short"] = False
+                # Region frames arrive sorted by views; merge out only the rows shown
+                combined_regular, combined_shorts = top_videos_and_shorts(combined_dfs, 30)
 
                 st.markdown("##### Combined regular videos")
-                combined_regular = df_combined[~df_combined["is_short"]].copy()
                 render_video_list(
-                    combined_regular.head(30),
+                    combined_regular,
                     section_key="combined_regular",
                     show_region=True,
                 )
 
                 st.markdown("##### Combined Shorts")
-                combined_shorts = df_combined[df_combined["is_short"]].copy()
                 render_video_list(
-                    combined_shorts.head(30),
+                    combined_shorts,
                     section_key="combined_shorts",
                     show_region=True,
                 )
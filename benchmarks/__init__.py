@@ -0,0 +1,3 @@
+# benchmarks – offline micro-benchmarks for the news_dashboard data layer
+#
+# Run from the repository root, e.g. `python -m benchmarks.bench_fields`.
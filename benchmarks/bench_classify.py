@@ -0,0 +1,104 @@
+# benchmarks/bench_classify.py – per-row vs batch duration parsing and Shorts classification
+#
+#   python -m benchmarks.bench_classify                  # 10k, 50k and 100k rows
+#   python -m benchmarks.bench_classify --rows 20000
+#
+# Three implementations are timed on the same columns and must agree exactly:
+#   per-row  the previous logic in normalize_videos (regex + lower() per item)
+#   pandas   Series.str.extract / str.lower / str.contains over the batch
+#   batch    parse_iso_durations + mark_shorts, as records_to_frame applies them
+import argparse
+import random
+
+import numpy as np
+import pandas as pd
+
+from news_dashboard.youtube import (
+    ISO_DURATION_RE,
+    mark_shorts,
+    parse_iso_duration,
+    parse_iso_durations,
+)
+
+from .payloads import best_of, make_payload
+
+# Same grammar and units as parse_iso_duration, for the str.extract variant
+_PANDAS_DURATION_RE = rf"^{ISO_DURATION_RE.pattern}$"
+_UNIT_SEC = np.array([365 * 86400, 30 * 86400, 7 * 86400, 86400, 3600, 60, 1], dtype=float)
+_HASHTAGS = ("#news", "#Politics", "#breaking", "#SHORTS", "#short", "#election2026")
+
+
+def _columns(n_rows: int, distinct_durations: bool, seed: int = 0):
+    """Titles, descriptions and durations for ``n_rows`` videos, with hashtags sprinkled in."""
+    rng = random.Random(seed)
+    base = make_payload(min(n_rows, 2000), seed=seed)["items"]
+    titles, descriptions, durations = [], [], []
+    for i in range(n_rows):
+        item = base[i % len(base)]
+        description = item["snippet"]["description"]
+        if i % 2:
+            description += " " + " ".join(rng.sample(_HASHTAGS, 3))
+        titles.append(item["snippet"]["title"])
+        descriptions.append(description)
+        if distinct_durations:
+            # Include the day and fractional forms the full grammar accepts
+            days = f"{rng.randint(1, 2)}D" if i % 7 == 0 else ""
+            frac = f".{rng.randint(0, 9)}" if i % 3 == 0 else ""
+            durations.append(
+                f"P{days}T{rng.randint(0, 3)}H{rng.randint(0, 59)}M{rng.randint(0, 59)}{frac}S"
+            )
+        else:
+            durations.append(item["contentDetails"]["duration"])
+    return titles, descriptions, durations
+
+
+def per_row(titles, descriptions, durations):
+    duration_sec = np.array([parse_iso_duration(d) for d in durations], dtype=np.int64)
+    is_short = np.empty(len(titles), dtype=bool)
+    for i, (title, description) in enumerate(zip(titles, descriptions)):
+        text = (title + " " + description).lower()
+        is_short[i] = "#shorts" in text or " #short " in text or 0 < duration_sec[i] <= 75
+    return duration_sec, is_short
+
+
+def with_pandas(titles, descriptions, durations):
+    parts = pd.Series(durations).str.extract(_PANDAS_DURATION_RE)
+    parts = parts.apply(lambda col: col.str.replace(",", ".")).astype(float).fillna(0)
+    duration_sec = np.floor(parts.to_numpy() @ _UNIT_SEC + 0.5).astype(np.int64)
+    text = (pd.Series(titles) + " " + pd.Series(descriptions)).str.lower()
+    tagged = text.str.contains("#shorts", regex=False) | text.str.contains(" #short ", regex=False)
+    return duration_sec, tagged.to_numpy() | ((duration_sec > 0) & (duration_sec <= 75))
+
+
+def batch(titles, descriptions, durations):
+    duration_sec = parse_iso_durations(durations)
+    return duration_sec, mark_shorts(titles, descriptions, duration_sec)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time per-row vs batch duration parsing and Shorts classification."
+    )
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 50_000, 100_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'durations':<10}{'per-row ms':>12}{'pandas ms':>11}{'batch ms':>10}{'speedup':>9}")
+    for n in args.rows:
+        for distinct in (False, True):
+            cols = _columns(n, distinct)
+            expected = per_row(*cols)
+            for fn in (with_pandas, batch):
+                got = fn(*cols)
+                assert all(np.array_equal(e, g) for e, g in zip(expected, got)), fn.__name__
+            t_row, _ = best_of(lambda: per_row(*cols), repeat=3, number=1)
+            t_pd, _ = best_of(lambda: with_pandas(*cols), repeat=3, number=1)
+            t_batch, _ = best_of(lambda: batch(*cols), repeat=3, number=1)
+            label = "distinct" if distinct else "chart"
+            print(
+                f"{n:>8} {label:<10}{t_row * 1e3:>12.1f}{t_pd * 1e3:>11.1f}"
+                f"{t_batch * 1e3:>10.1f}{t_row / t_batch:>8.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# benchmarks/bench_combined.py – combined ranking: concat + full sort vs top-K heap merge
+#
+#   python -m benchmarks.bench_combined                       # 10 regions x 50/200/2000 rows
+#   python -m benchmarks.bench_combined --regions 30 --rows 500
+#
+# Both sides produce the Combined tab's two sections (top 30 regular videos,
+# top 30 Shorts) from per-region frames sorted by views; the script checks
+# they agree, then times them.
+import argparse
+
+import pandas as pd
+
+from news_dashboard.ranking import top_videos_and_shorts
+from news_dashboard.youtube import REGION_LABELS_BY_CODE, normalize_videos, sort_by_views
+
+from .payloads import best_of, make_payload
+
+
+def concat_sort(frames, k: int):
+    """The previous app code: one frame of every row, fully sorted, then filtered."""
+    df = pd.concat(frames, ignore_index=True)
+    df.sort_values("view_count", ascending=False, inplace=True)
+    df.reset_index(drop=True, inplace=True)
+    return df[~df["is_short"]].head(k), df[df["is_short"]].head(k)
+
+
+def heap_merge(frames, k: int):
+    return top_videos_and_shorts(frames, k)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time the combined-regions ranking with concat + sort vs a top-K merge."
+    )
+    parser.add_argument("--regions", type=int, default=10)
+    parser.add_argument("--rows", type=int, nargs="+", default=[50, 200, 2000])
+    parser.add_argument("-k", type=int, default=30)
+    args = parser.parse_args()
+
+    codes = list(REGION_LABELS_BY_CODE)
+    print(f"{'regions':>8}{'rows':>7}{'concat+sort ms':>16}{'top-K ms':>10}{'speedup':>9}")
+    for n in args.rows:
+        frames = []
+        for i in range(args.regions):
+            code = codes[i % len(codes)]
+            items = make_payload(n, code, seed=i)["items"]
+            frames.append(sort_by_views(normalize_videos(items, code)))
+        for expected, got in zip(concat_sort(frames, args.k), heap_merge(frames, args.k)):
+            assert expected["video_id"].tolist() == got["video_id"].tolist()
+            assert expected.index.tolist() == got.index.tolist()
+        t_sort, _ = best_of(lambda: concat_sort(frames, args.k))
+        t_heap, _ = best_of(lambda: heap_merge(frames, args.k))
+        print(
+            f"{args.regions:>8}{n:>7}{t_sort * 1e3:>16.2f}{t_heap * 1e3:>10.2f}"
+            f"{t_sort / t_heap:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+# benchmarks/bench_decode.py – decoding videos.list items: row dicts, column lists, VideoRecords
+#
+#   python -m benchmarks.bench_decode                 # 1,000 items
+#   python -m benchmarks.bench_decode --items 200 5000
+#
+# "dicts" is the original loop: nested .get() calls with a fresh {} default
+# per lookup and one 14-key dict per video. "lists" is the column loop that
+# replaced it, appending to nine lists. "records" is decode_videos. Both
+# "lists" and "records" keep raw durations; parsing them and classifying
+# Shorts happens per batch when the frame is built. The "frame" rows time
+# the two library paths end to end: normalize_videos (column lists, used for
+# whole pages) and records_to_frame(decode_videos(...)) (records plus the
+# zip(*records) transpose, used when streaming). The script checks that
+# all of them agree, then reports time and tracemalloc peak / retained
+# bytes per 1k items.
+import argparse
+import tracemalloc
+from typing import Callable, List, Optional
+
+import pandas as pd
+
+from news_dashboard.youtube import (
+    VideoRecord,
+    decode_videos,
+    normalize_videos,
+    parse_iso_duration,
+    records_to_frame,
+)
+
+from .payloads import best_of, make_payload
+
+
+def decode_dicts(items: List[dict], region_code: str = "US") -> List[dict]:
+    videos: List[dict] = []
+    for rank, item in enumerate(items, start=1):
+        vid = item.get("id")
+        snippet = item.get("snippet", {}) or {}
+        stats = item.get("statistics", {}) or {}
+        details = item.get("contentDetails", {}) or {}
+        thumbs = (snippet.get("thumbnails") or {}) or {}
+        thumb_obj = (
+            thumbs.get("medium")
+            or thumbs.get("high")
+            or thumbs.get("standard")
+            or thumbs.get("default")
+            or {}
+        )
+        duration_sec = parse_iso_duration(details.get("duration", ""))
+        text = (snippet.get("title", "") + " " + snippet.get("description", "")).lower()
+        videos.append(
+            {
+                "region_code": region_code,
+                "region_label": region_code,
+                "video_id": vid,
+                "title": snippet.get("title", ""),
+                "description": snippet.get("description", "") or "",
+                "channel_title": snippet.get("channelTitle", "") or "",
+                "published_at": snippet.get("publishedAt", ""),
+                "view_count": int(stats.get("viewCount", 0)),
+                "like_count": int(stats["likeCount"]) if "likeCount" in stats else None,
+                "duration_sec": duration_sec,
+                "is_short": "#shorts" in text or " #short " in text or 0 < duration_sec <= 75,
+                "thumbnail_url": thumb_obj.get("url"),
+                "url": f"https://www.youtube.com/watch?v={vid}",
+                "trending_rank": rank,
+            }
+        )
+    return videos
+
+
+def decode_lists(items: List[dict]) -> tuple:
+    video_ids: List[Optional[str]] = []
+    titles: List[str] = []
+    descriptions: List[str] = []
+    channel_titles: List[str] = []
+    published_at: List[str] = []
+    thumbnail_urls: List[Optional[str]] = []
+    view_counts: List[int] = []
+    like_counts: List[Optional[int]] = []
+    durations: List[str] = []
+
+    for item in items:
+        snippet = item.get("snippet", {}) or {}
+        stats = item.get("statistics", {}) or {}
+        details = item.get("contentDetails", {}) or {}
+        thumbs = (snippet.get("thumbnails") or {}) or {}
+        thumb_obj = (
+            thumbs.get("medium")
+            or thumbs.get("high")
+            or thumbs.get("standard")
+            or thumbs.get("default")
+            or {}
+        )
+        video_ids.append(item.get("id"))
+        titles.append(snippet.get("title", ""))
+        descriptions.append(snippet.get("description", "") or "")
+        channel_titles.append(snippet.get("channelTitle", "") or "")
+        published_at.append(snippet.get("publishedAt", ""))
+        thumbnail_urls.append(thumb_obj.get("url"))
+        view_counts.append(int(stats.get("viewCount", 0)))
+        like_counts.append(int(stats["likeCount"]) if "likeCount" in stats else None)
+        durations.append(details.get("duration", ""))
+
+    return (
+        video_ids,
+        titles,
+        descriptions,
+        channel_titles,
+        published_at,
+        view_counts,
+        like_counts,
+        durations,
+        thumbnail_urls,
+    )
+
+
+def _memory(fn: Callable[[], object]) -> tuple:
+    """(peak, retained) bytes allocated while ``fn`` runs, retained = still held by its result."""
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    result = fn()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak - base, retained - base
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time decoding videos.list items into column lists vs VideoRecords, and the frames."
+    )
+    parser.add_argument("--items", type=int, nargs="+", default=[1000])
+    args = parser.parse_args()
+
+    print(
+        f"{'items':>8} {'decoder':<16}{'ms/1k':>8}{'peak KiB/1k':>13}{'retained KiB/1k':>17}"
+    )
+    for n in args.items:
+        items = make_payload(n)["items"]
+        records = decode_videos(items)
+        for col, expected in zip(zip(*records), decode_lists(items)):
+            assert list(col) == list(expected)
+        rows = decode_dicts(items)
+        fields = [field for field in VideoRecord._fields if field != "duration"]
+        for record, row in zip(records, rows):
+            assert [getattr(record, field) for field in fields] == [row[f] for f in fields]
+        frame = normalize_videos(items, "US")
+        pd.testing.assert_frame_equal(frame, records_to_frame(records, "US"))
+        for col in ("duration_sec", "is_short"):
+            assert frame[col].tolist() == [row[col] for row in rows]
+
+        per_1k = 1000 / n
+        for label, fn in (
+            ("dicts", lambda: decode_dicts(items)),
+            ("lists", lambda: decode_lists(items)),
+            ("records", lambda: decode_videos(items)),
+            ("lists frame", lambda: normalize_videos(items, "US")),
+            ("records frame", lambda: records_to_frame(decode_videos(items), "US")),
+        ):
+            t, _ = best_of(fn, number=max(1, 20_000 // n))
+            peak, retained = _memory(fn)
+            print(
+                f"{n:>8} {label:<16}{t * 1e3 * per_1k:>8.2f}"
+                f"{peak / 1024 * per_1k:>13.1f}{retained / 1024 * per_1k:>17.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
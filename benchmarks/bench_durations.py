@@ -0,0 +1,153 @@
+# benchmarks/bench_durations.py – correctness and throughput of parse_iso_duration
+#
+#   python -m benchmarks.bench_durations              # checks, then 100k strings
+#   python -m benchmarks.bench_durations --strings 1000000
+#
+# The checks cover every form videos.list emits for contentDetails.duration
+# plus the rest of the ISO-8601 grammar, and the Shorts flag each duration
+# leads to; the script exits non-zero on any mismatch. Throughput compares
+# the previous PT-only parser with the new one uncached and memoized, on a
+# stream that repeats like trending charts do.
+import argparse
+import random
+import re
+import sys
+
+from news_dashboard.youtube import mark_shorts, parse_iso_duration, parse_iso_durations
+
+from .payloads import best_of
+
+CASES = [
+    # What the API emits
+    ("PT45S", 45),
+    ("PT1M", 60),
+    ("PT3M12S", 192),
+    ("PT1H", 3600),
+    ("PT1H2M3S", 3723),
+    ("PT10H0M1S", 36001),
+    ("P1D", 86400),
+    ("P1DT2H", 93600),
+    ("P1DT2H3M4S", 93784),
+    ("P3DT0S", 259200),
+    ("P0D", 0),  # live streams and premieres
+    ("PT0S", 0),
+    # Rest of the grammar
+    ("P1W", 604800),
+    ("P1W2D", 777600),
+    ("P1M", 30 * 86400),
+    ("P1Y", 365 * 86400),
+    ("P1Y2M3W4DT5H6M7S", 365 * 86400 + 60 * 86400 + 21 * 86400 + 4 * 86400 + 18367),
+    ("PT1.5S", 2),
+    ("PT1,5S", 2),
+    ("PT75.4S", 75),
+    ("PT0.5H", 1800),
+    ("PT120M", 7200),
+    ("PT3600S", 3600),
+    # Malformed
+    ("", 0),
+    (None, 0),
+    ("P", 0),
+    ("PT", 0),
+    ("P1DT", 0),
+    ("T1H", 0),
+    ("1H", 0),
+    ("PT1S1M", 0),
+    ("PT-1S", 0),
+    ("pt1m", 0),
+    ("PT1M ", 0),
+]
+
+# (duration, title, is_short): zero or unknown durations are not Shorts by length
+SHORTS_CASES = [
+    ("PT45S", "Update", True),
+    ("PT75S", "Update", True),
+    ("PT75.4S", "Update", True),
+    ("PT76S", "Update", False),
+    ("P0D", "LIVE: election night", False),
+    ("PT0S", "Update", False),
+    ("", "Update", False),
+    ("P0D", "Live now #shorts", True),
+    ("PT10M", "Recap #Shorts", True),
+]
+
+_OLD_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?")
+
+
+def parse_pt_only(s: str) -> int:
+    """The previous parser: PT#H#M#S only, anything else is 0."""
+    if not s:
+        return 0
+    m = _OLD_RE.fullmatch(s)
+    if not m:
+        return 0
+    h, m_, s_ = m.groups()
+    return int(h or 0) * 3600 + int(m_ or 0) * 60 + int(s_ or 0)
+
+
+def check() -> int:
+    failures = 0
+    for value, expected in CASES:
+        got = parse_iso_duration(value)
+        if got != expected:
+            failures += 1
+            print(f"FAIL {value!r}: expected {expected}, got {got}")
+    batch = parse_iso_durations([value for value, _ in CASES])
+    if list(batch) != [expected for _, expected in CASES]:
+        failures += 1
+        print("FAIL parse_iso_durations disagrees with parse_iso_duration")
+    durations = [duration for duration, _, _ in SHORTS_CASES]
+    titles = [title for _, title, _ in SHORTS_CASES]
+    flags = mark_shorts(titles, [""] * len(titles), parse_iso_durations(durations))
+    for (duration, title, expected), got in zip(SHORTS_CASES, flags):
+        if got != expected:
+            failures += 1
+            print(f"FAIL is_short {duration!r} / {title!r}: expected {expected}, got {got}")
+    changed = [v for v, _ in CASES if v and parse_pt_only(v) != parse_iso_duration(v)]
+    print(f"{len(CASES) + len(SHORTS_CASES)} cases checked, {failures} failures")
+    print(f"parsed differently than before: {', '.join(changed)}\n")
+    return failures
+
+
+def _stream(n: int, seed: int = 0) -> list:
+    """Durations with trending-chart repetition: a few thousand distinct values."""
+    rng = random.Random(seed)
+    pool = [f"PT{rng.randint(0, 59)}M{rng.randint(0, 59)}S" for _ in range(2000)]
+    pool += [f"PT{rng.randint(1, 9)}H{rng.randint(0, 59)}M{rng.randint(0, 59)}S" for _ in range(500)]
+    pool += [f"P{rng.randint(1, 3)}DT{rng.randint(0, 23)}H{rng.randint(0, 59)}M" for _ in range(20)]
+    pool += ["P0D"] * 50
+    return [rng.choice(pool) for _ in range(n)]
+
+
+def throughput(n: int) -> None:
+    values = _stream(n)
+    uncached = parse_iso_duration.__wrapped__
+
+    t_old, _ = best_of(lambda: [parse_pt_only(v) for v in values], repeat=3, number=1)
+    t_cold, _ = best_of(lambda: [uncached(v) for v in values], repeat=3, number=1)
+    t_memo, _ = best_of(lambda: [parse_iso_duration(v) for v in values], repeat=3, number=1)
+    t_batch, _ = best_of(lambda: parse_iso_durations(values), repeat=3, number=1)
+
+    print(f"{n:,} strings, {len(set(values)):,} distinct")
+    for label, t in (
+        ("previous PT-only", t_old),
+        ("full grammar, uncached", t_cold),
+        ("full grammar, memoized", t_memo),
+        ("parse_iso_durations", t_batch),
+    ):
+        print(f"  {label:<24}{t * 1e3:>9.1f} ms{n / t / 1e6:>8.2f} M/s")
+    print(f"  cache: {parse_iso_duration.cache_info()}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Check parse_iso_duration against the ISO-8601 forms and time it."
+    )
+    parser.add_argument("--strings", type=int, default=100_000)
+    args = parser.parse_args()
+    failures = check()
+    throughput(args.strings)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# benchmarks/bench_fields.py – response size / parse time with and without `fields=`
+#
+#   python -m benchmarks.bench_fields            # offline, synthetic payloads
+#   python -m benchmarks.bench_fields --live US  # real API (needs YOUTUBE_API_KEY)
+import argparse
+import gzip
+import json
+import os
+import time
+
+from news_dashboard.fields import VIDEO_FIELDS, field_tree
+from news_dashboard.session import get_session
+from news_dashboard.youtube import API_KEY_HEADER, YOUTUBE_API_URL, normalize_videos
+
+from .payloads import best_of, make_payload, project
+
+
+def _row(label: str, full: float, trimmed: float, unit: str) -> str:
+    saved = 100.0 * (1 - trimmed / full) if full else 0.0
+    return f"{label:<24}{full:>14,.1f}{trimmed:>14,.1f}  {unit:<6}{saved:>7.1f}% saved"
+
+
+def offline(n_items: int) -> None:
+    full = make_payload(n_items, next_page_token="CDIQAA")
+    tree = {"items": field_tree(), "nextPageToken": {}}
+    trimmed = project(full, tree)
+
+    full_raw = json.dumps(full).encode()
+    trimmed_raw = json.dumps(trimmed).encode()
+
+    t_full, _ = best_of(lambda: json.loads(full_raw))
+    t_trim, _ = best_of(lambda: json.loads(trimmed_raw))
+    n_full, _ = best_of(lambda: normalize_videos(json.loads(full_raw)["items"], "US"), number=5)
+    n_trim, _ = best_of(lambda: normalize_videos(json.loads(trimmed_raw)["items"], "US"), number=5)
+
+    print(f"fields={VIDEO_FIELDS}\n")
+    print(f"{n_items} items per page{'full':>18}{'trimmed':>14}")
+    print(_row("body bytes", len(full_raw), len(trimmed_raw), "B"))
+    print(_row("gzip bytes", len(gzip.compress(full_raw)), len(gzip.compress(trimmed_raw)), "B"))
+    print(_row("json.loads", t_full * 1e3, t_trim * 1e3, "ms"))
+    print(_row("loads + normalize", n_full * 1e3, n_trim * 1e3, "ms"))
+
+
+def live(region_code: str) -> None:
+    api_key = os.environ["YOUTUBE_API_KEY"]
+    base = {
+        "part": "snippet,statistics,contentDetails",
+        "chart": "mostPopular",
+        "regionCode": region_code,
+        "videoCategoryId": "25",
+        "maxResults": 50,
+    }
+    results = {}
+    for label, params in (("full", base), ("trimmed", {**base, "fields": VIDEO_FIELDS})):
+        started = time.perf_counter()
+        resp = get_session().get(
+            f"{YOUTUBE_API_URL}/videos",
+            params=params,
+            headers={API_KEY_HEADER: api_key},
+            timeout=15,
+        )
+        resp.raise_for_status()
+        elapsed = time.perf_counter() - started
+        wire = int(resp.headers.get("Content-Length", 0) or 0)
+        parse, _ = best_of(lambda: json.loads(resp.content))
+        results[label] = (len(resp.content), wire, elapsed, parse)
+
+    (fb, fw, fe, fp), (tb, tw, te, tp) = results["full"], results["trimmed"]
+    print(f"region {region_code}{'full':>30}{'trimmed':>14}")
+    print(_row("body bytes", fb, tb, "B"))
+    if fw and tw:
+        print(_row("wire bytes (gzip)", fw, tw, "B"))
+    print(_row("request latency", fe * 1e3, te * 1e3, "ms"))
+    print(_row("json.loads", fp * 1e3, tp * 1e3, "ms"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare videos.list payloads with and without fields="
+    )
+    parser.add_argument("--items", type=int, default=50, help="items per synthetic page")
+    parser.add_argument("--live", metavar="REGION", help="compare against the real API")
+    args = parser.parse_args()
+    if args.live:
+        live(args.live)
+    else:
+        offline(args.items)
+
+
+if __name__ == "__main__":
+    main()
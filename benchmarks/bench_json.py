@@ -0,0 +1,127 @@
+# benchmarks/bench_json.py – JSON decode time per backend, and its share of fetch latency
+#
+#   python -m benchmarks.bench_json                          # synthetic pages
+#   python -m benchmarks.bench_json --record rec US GB IN    # save real responses (needs YOUTUBE_API_KEY)
+#   python -m benchmarks.bench_json --replay rec             # decode the saved responses
+#
+# --record stores each region's raw videos.list body (as the dashboard requests
+# it, with fields=) plus the measured request latency in rec/index.json.
+# --replay decodes those bodies with every installed backend and reports the
+# decode time as a share of the recorded latency.
+import argparse
+import json
+import os
+import time
+from typing import Dict, List, Tuple
+
+from news_dashboard.fields import VIDEO_FIELDS, VIDEO_PARTS, field_tree
+from news_dashboard.jsonlib import JSON_DECODERS, json_backend
+from news_dashboard.session import get_session
+from news_dashboard.youtube import (
+    API_KEY_HEADER,
+    MAX_RESULTS_PER_PAGE,
+    NEWS_CATEGORY_ID,
+    YOUTUBE_API_URL,
+)
+
+from .payloads import best_of, make_payload, project
+
+
+def _decode_times(body: bytes) -> Dict[str, float]:
+    expected = json.loads(body)
+    times = {}
+    for name, loads in JSON_DECODERS.items():
+        assert loads(body) == expected, name
+        times[name], _ = best_of(lambda: loads(body), number=20)
+    return times
+
+
+def _report(rows: List[Tuple[str, bytes, float]]) -> None:
+    """``rows`` are (label, body, request latency in seconds or 0 if unknown)."""
+    names = list(JSON_DECODERS)
+    header = f"{'response':<14}{'KiB':>8}{'latency ms':>12}"
+    header += "".join(f"{name + ' ms':>13}{'share':>8}" for name in names)
+    print(f"backend in use: {json_backend()}\n\n{header}")
+    for label, body, latency in rows:
+        times = _decode_times(body)
+        line = f"{label:<14}{len(body) / 1024:>8.1f}"
+        line += f"{latency * 1e3:>12.1f}" if latency else f"{'-':>12}"
+        for name in names:
+            share = f"{times[name] / latency:.1%}" if latency else "-"
+            line += f"{times[name] * 1e3:>13.3f}{share:>8}"
+        print(line)
+
+
+def synthetic(n_items: int, latency_ms: float) -> None:
+    full = make_payload(n_items, next_page_token="CDIQAA")
+    trimmed = project(full, {"items": field_tree(), "nextPageToken": {}})
+    latency = latency_ms / 1e3
+    _report(
+        [
+            ("full", json.dumps(full).encode(), latency),
+            ("fields=", json.dumps(trimmed).encode(), latency),
+        ]
+    )
+
+
+def record(directory: str, regions: List[str]) -> None:
+    os.makedirs(directory, exist_ok=True)
+    index = {}
+    for region_code in regions:
+        params = {
+            "part": VIDEO_PARTS,
+            "fields": VIDEO_FIELDS,
+            "chart": "mostPopular",
+            "regionCode": region_code,
+            "videoCategoryId": NEWS_CATEGORY_ID,
+            "maxResults": MAX_RESULTS_PER_PAGE,
+        }
+        started = time.perf_counter()
+        resp = get_session().get(
+            f"{YOUTUBE_API_URL}/videos",
+            params=params,
+            headers={API_KEY_HEADER: os.environ["YOUTUBE_API_KEY"]},
+            timeout=15,
+        )
+        resp.raise_for_status()
+        latency = time.perf_counter() - started
+        with open(os.path.join(directory, f"{region_code}.json"), "wb") as fh:
+            fh.write(resp.content)
+        index[region_code] = {"latency_sec": latency, "bytes": len(resp.content)}
+        print(f"{region_code}: {len(resp.content):,} B in {latency * 1e3:.0f} ms")
+    with open(os.path.join(directory, "index.json"), "w") as fh:
+        json.dump(index, fh, indent=2)
+
+
+def replay(directory: str) -> None:
+    with open(os.path.join(directory, "index.json")) as fh:
+        index = json.load(fh)
+    rows = []
+    for region_code, meta in index.items():
+        with open(os.path.join(directory, f"{region_code}.json"), "rb") as fh:
+            rows.append((region_code, fh.read(), meta["latency_sec"]))
+    _report(rows)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time JSON decoding of videos.list responses with each installed backend."
+    )
+    parser.add_argument("--items", type=int, default=50, help="items per synthetic page")
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="assumed request latency for synthetic pages"
+    )
+    parser.add_argument("--record", metavar="DIR", help="save real responses to DIR")
+    parser.add_argument("--replay", metavar="DIR", help="decode responses saved with --record")
+    parser.add_argument("regions", nargs="*", default=["US"], help="regions to --record")
+    args = parser.parse_args()
+    if args.record:
+        record(args.record, args.regions)
+    elif args.replay:
+        replay(args.replay)
+    else:
+        synthetic(args.items, args.latency_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# benchmarks/bench_memory.py – bytes per row of video frames, before and after the compact schema
+#
+#   python -m benchmarks.bench_memory                   # one region, then 30 regions x 48 snapshots
+#   python -m benchmarks.bench_memory --regions 10 --snapshots 96
+#
+# "before" is the layout normalize_videos produced without a schema: Python
+# object strings, int64 counts, and float64 like_count (NaN for hidden likes).
+# Sizes are memory_usage(deep=True), so string payloads are counted.
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from news_dashboard.schema import VIDEO_DTYPES, apply_video_schema
+from news_dashboard.youtube import REGION_LABELS_BY_CODE, normalize_videos
+
+from .payloads import make_payload
+
+
+def legacy_layout(df: pd.DataFrame) -> pd.DataFrame:
+    casts = {}
+    for col, dtype in VIDEO_DTYPES.items():
+        if dtype == "int32":
+            casts[col] = np.int64
+        elif dtype == "Int64":
+            casts[col] = np.float64
+        elif dtype not in ("int64", "bool"):
+            casts[col] = object
+    return df.astype(casts)
+
+
+def _history(n_regions: int, n_snapshots: int, items: int) -> pd.DataFrame:
+    """``n_snapshots`` charts per region, stacked the way retained history would be."""
+    codes = list(REGION_LABELS_BY_CODE)[:n_regions]
+    frames = [
+        normalize_videos(make_payload(items, region_code=code, seed=seed)["items"], code)
+        for code in codes
+        for seed in range(n_snapshots)
+    ]
+    return apply_video_schema(pd.concat(frames, ignore_index=True))
+
+
+def report(label: str, compact: pd.DataFrame) -> None:
+    legacy = legacy_layout(compact)
+    rows = len(compact)
+    before = legacy.memory_usage(deep=True, index=False)
+    after = compact.memory_usage(deep=True, index=False)
+
+    print(f"{label}: {rows:,} rows")
+    print(f"  {'column':<16}{'before dtype':<14}{'after dtype':<16}{'before B/row':>13}{'after B/row':>12}")
+    for col in compact.columns:
+        print(
+            f"  {col:<16}{str(legacy[col].dtype):<14}{str(compact[col].dtype):<16}"
+            f"{before[col] / rows:>13.1f}{after[col] / rows:>12.1f}"
+        )
+    total_before, total_after = before.sum(), after.sum()
+    print(
+        f"  {'total':<46}{total_before / rows:>13.1f}{total_after / rows:>12.1f}"
+        f"   ({total_before / 2**20:.1f} MiB -> {total_after / 2**20:.1f} MiB,"
+        f" {1 - total_after / total_before:.0%} smaller)\n"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Report bytes per row of video frames with and without the compact schema."
+    )
+    parser.add_argument("--items", type=int, default=50, help="videos per chart")
+    parser.add_argument("--regions", type=int, default=len(REGION_LABELS_BY_CODE))
+    parser.add_argument("--snapshots", type=int, default=48, help="charts retained per region")
+    args = parser.parse_args()
+
+    report("one region", normalize_videos(make_payload(args.items)["items"], "US"))
+    report(
+        f"history, {args.regions} regions x {args.snapshots} snapshots",
+        _history(args.regions, args.snapshots, args.items),
+    )
+
+
+if __name__ == "__main__":
+    main()
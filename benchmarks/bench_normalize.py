@@ -0,0 +1,77 @@
+# benchmarks/bench_normalize.py – row-dict vs record-and-column normalization of videos.list items
+#
+#   python -m benchmarks.bench_normalize                   # 50 .. 20,000 items
+#   python -m benchmarks.bench_normalize --items 200 5000
+import argparse
+from typing import List
+
+import pandas as pd
+
+from news_dashboard.schema import apply_video_schema
+from news_dashboard.youtube import REGION_LABELS_BY_CODE, normalize_videos, parse_iso_duration
+
+from .payloads import best_of, make_payload
+
+
+def normalize_records(items: List[dict], region_code: str, start_rank: int = 1) -> pd.DataFrame:
+    """The original implementation: one dict per video, then ``pd.DataFrame(list_of_dicts)``."""
+    videos: List[dict] = []
+    region_label = REGION_LABELS_BY_CODE.get(region_code, region_code)
+    for rank, item in enumerate(items, start=start_rank):
+        vid = item.get("id")
+        snippet = item.get("snippet", {}) or {}
+        stats = item.get("statistics", {}) or {}
+        details = item.get("contentDetails", {}) or {}
+        thumbs = (snippet.get("thumbnails") or {}) or {}
+        thumb_obj = (
+            thumbs.get("medium")
+            or thumbs.get("high")
+            or thumbs.get("standard")
+            or thumbs.get("default")
+            or {}
+        )
+        duration_sec = parse_iso_duration(details.get("duration", ""))
+        text = (snippet.get("title", "") + " " + snippet.get("description", "")).lower()
+        marked_as_shorts = "#shorts" in text or " #short " in text
+        videos.append(
+            {
+                "region_code": region_code,
+                "region_label": region_label,
+                "video_id": vid,
+                "title": snippet.get("title", ""),
+                "description": snippet.get("description", "") or "",
+                "channel_title": snippet.get("channelTitle", "") or "",
+                "published_at": snippet.get("publishedAt", ""),
+                "view_count": int(stats.get("viewCount", 0)),
+                "like_count": int(stats.get("likeCount", 0)) if "likeCount" in stats else None,
+                "duration_sec": duration_sec,
+                "is_short": marked_as_shorts or 0 < duration_sec <= 75,
+                "thumbnail_url": thumb_obj.get("url"),
+                "url": f"https://www.youtube.com/watch?v={vid}",
+                "trending_rank": rank,
+            }
+        )
+    if not videos:
+        return pd.DataFrame()
+    return apply_video_schema(pd.DataFrame(videos))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time normalize_videos against the original row-dict implementation."
+    )
+    parser.add_argument("--items", type=int, nargs="+", default=[50, 200, 2000, 20000])
+    args = parser.parse_args()
+
+    print(f"{'items':>8}{'row dicts ms':>15}{'current ms':>13}{'speedup':>10}")
+    for n in args.items:
+        items = make_payload(n)["items"]
+        pd.testing.assert_frame_equal(normalize_records(items, "US"), normalize_videos(items, "US"))
+        number = max(1, 2000 // n)
+        t_rows, _ = best_of(lambda: normalize_records(items, "US"), number=number)
+        t_cols, _ = best_of(lambda: normalize_videos(items, "US"), number=number)
+        print(f"{n:>8}{t_rows * 1e3:>15.2f}{t_cols * 1e3:>13.2f}{t_rows / t_cols:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
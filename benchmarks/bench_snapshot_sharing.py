@@ -0,0 +1,116 @@
+# benchmarks/bench_snapshot_sharing.py – reader memory with SQLite/JSON vs memory-mapped Arrow snapshots
+#
+#   python -m benchmarks.bench_snapshot_sharing                 # 1, 2, 4 and 8 readers
+#   python -m benchmarks.bench_snapshot_sharing --readers 1 16 --rows 10000
+#
+# Each reader process loads every region's snapshot and keeps the frames
+# alive, like a Streamlit replica does. Reported is the growth of the
+# readers' summed PSS (proportional set size: pages shared by k processes
+# count 1/k to each) caused by loading, so shared pages are not double
+# counted. Linux only (reads /proc/self/smaps_rollup).
+import argparse
+import multiprocessing as mp
+import os
+import tempfile
+import time
+
+from news_dashboard.youtube import normalize_videos
+
+from .payloads import make_payload
+
+_REGIONS = ("US", "CA", "GB", "IN", "AU", "DE", "FR", "BR", "JP", "MX")
+
+
+def _pss_kib() -> int:
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Pss:"):
+                return int(line.split()[1])
+    return 0
+
+
+def _open(backend: str, path: str):
+    if backend == "arrow":
+        from news_dashboard.arrow_store import ArrowSnapshotStore
+
+        return ArrowSnapshotStore(path)
+    from news_dashboard.store import SnapshotStore
+
+    return SnapshotStore(path)
+
+
+def _reader(backend, path, keys, ready, loaded, out) -> None:
+    store = _open(backend, path)
+    ready.wait()
+    before = _pss_kib()
+    frames = [store.load(key).df for key in keys]
+    for df in frames:
+        # Touch every value, as rendering the page would
+        for col in df.columns:
+            if df[col].dtype.kind in "OSUT" or str(df[col].dtype) == "str":
+                df[col].str.len().sum()
+            else:
+                df[col].sum()
+    loaded.wait()
+    out.put(_pss_kib() - before)
+    loaded.wait()  # keep the frames alive until every reader has measured
+
+
+def _publish(backend: str, path: str, rows: int) -> list:
+    store = _open(backend, path)
+    keys = []
+    for code in _REGIONS:
+        df = normalize_videos(make_payload(rows, code)["items"], code)
+        key = (code, "25", rows)
+        store.save(key, df)
+        keys.append(key)
+    store.close()
+    return keys
+
+
+def measure(backend: str, path: str, keys: list, n_readers: int) -> float:
+    ctx = mp.get_context("spawn")
+    ready, loaded = ctx.Barrier(n_readers), ctx.Barrier(n_readers)
+    out = ctx.Queue()
+    procs = [
+        ctx.Process(target=_reader, args=(backend, path, keys, ready, loaded, out))
+        for _ in range(n_readers)
+    ]
+    for p in procs:
+        p.start()
+    total = sum(out.get() for _ in procs)
+    for p in procs:
+        p.join()
+    return total / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Summed reader PSS growth for SQLite/JSON vs Arrow IPC snapshots."
+    )
+    parser.add_argument("--readers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--rows", type=int, default=5000, help="videos per region")
+    args = parser.parse_args()
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        raise SystemExit("Needs Linux /proc/self/smaps_rollup")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {
+            "sqlite": os.path.join(tmp, "snapshots.sqlite3"),
+            "arrow": os.path.join(tmp, "arrow"),
+        }
+        started = time.perf_counter()
+        keys = {b: _publish(b, p, args.rows) for b, p in paths.items()}
+        print(
+            f"{len(_REGIONS)} regions x {args.rows} videos published "
+            f"in {time.perf_counter() - started:.1f}s\n"
+        )
+        print(f"{'readers':>8}{'sqlite/json MiB':>18}{'arrow mmap MiB':>18}")
+        for n in args.readers:
+            sqlite_mib = measure("sqlite", paths["sqlite"], keys["sqlite"], n)
+            arrow_mib = measure("arrow", paths["arrow"], keys["arrow"], n)
+            print(f"{n:>8}{sqlite_mib:>18.1f}{arrow_mib:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
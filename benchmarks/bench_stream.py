@@ -0,0 +1,175 @@
+# benchmarks/bench_stream.py – buffered vs streamed decoding of a videos.list response
+#
+#   python -m benchmarks.bench_stream                        # 50 items, 2 MB/s link
+#   python -m benchmarks.bench_stream --items 200 --mbps 0.5
+#
+# A local HTTP server sends one synthetic page (all parts, as without fields=)
+# in chunks paced to --mbps. "buffered" reads the whole body, then decodes it
+# and every item; "streamed" decodes items with iter_response_array as chunks
+# arrive. Reported: time to the first record, time to the last, and the
+# tracemalloc peak while handling the response.
+#
+# First, iter_json_array is checked against json.loads on documents split in
+# two at every byte offset, and fed one byte at a time: numbers, escapes and
+# multi-byte characters cut by a chunk boundary, plus malformed input that
+# must raise. The script exits non-zero on any mismatch.
+import argparse
+import json
+import sys
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterable, List
+
+from news_dashboard.jsonlib import decode_json, iter_json_array, iter_response_array
+from news_dashboard.session import get_session
+from news_dashboard.youtube import STREAM_CHUNK_SIZE, VideoRecord, decode_video
+
+from .payloads import make_payload
+
+_SEND_CHUNK = 8192
+
+# Valid documents: the parsed "items" and envelope must match json.loads
+DOCUMENTS = [
+    b'{"items": [1.5, -4.5e3, 0, -0.25, 1E-2, 12345678901234567890, 2e+3]}',
+    b'{"kind": "list", "items": [{"n": -12.75e-1, "s": "a\\"b\\\\c\\u00e9"}], "next": 7}',
+    b'{"items": [], "nextPageToken": "CDIQAA"}',
+    b'{"a": [1, 2], "items": [true, false, null, [], {}], "z": {"k": [3.0]}}',
+    '{"items": ["日本語 😀 ünï", {"t": "€"}], "n": 10.5}'.encode(),
+    b'{ "items" : [ 1 , 2.5 , "x" ] , "e" : 1e5 }',
+    b'{}',
+]
+
+# Malformed documents: every split must raise
+MALFORMED = [
+    b'{"items": [1.x]}',
+    b'{"items": [1, 2}',
+    b'{"items": [1 2]}',
+    b'{"items": [-]}',
+    b'{"items": [1]} extra',
+    b'{"items": [{"a": 1}',
+]
+
+
+def _parse(chunks: Iterable[bytes]) -> tuple:
+    envelope: dict = {}
+    items = list(iter_json_array(chunks, "items", envelope))
+    return items, envelope
+
+
+def _splits(doc: bytes):
+    yield [doc]
+    yield [doc[i:i + 1] for i in range(len(doc))]
+    for i in range(len(doc) + 1):
+        yield [doc[:i], doc[i:]]
+
+
+def check() -> int:
+    failures = 0
+    documents = DOCUMENTS + [json.dumps(make_payload(3), ensure_ascii=False).encode()]
+    for doc in documents:
+        full = json.loads(doc)
+        expected = (full.pop("items", []), full)
+        for chunks in _splits(doc):
+            try:
+                got = _parse(chunks)
+            except ValueError as exc:
+                got = exc
+            if got != expected:
+                failures += 1
+                print(f"FAIL {doc[:40]!r} split {[len(c) for c in chunks][:4]}: {got!r:.80}")
+    for doc in MALFORMED:
+        for chunks in _splits(doc):
+            try:
+                _parse(chunks)
+            except ValueError:
+                continue
+            failures += 1
+            print(f"FAIL {doc!r} split {[len(c) for c in chunks][:4]}: no error")
+    print(f"{len(documents) + len(MALFORMED)} documents checked at every split, {failures} failures\n")
+    return failures
+
+
+def _serve(body: bytes, bytes_per_sec: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            started = time.perf_counter()
+            for offset in range(0, len(body), _SEND_CHUNK):
+                self.wfile.write(body[offset:offset + _SEND_CHUNK])
+                self.wfile.flush()
+                due = started + (offset + _SEND_CHUNK) / bytes_per_sec
+                time.sleep(max(0.0, due - time.perf_counter()))
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def buffered(url: str, on_record: Callable[[VideoRecord], None]) -> None:
+    resp = get_session().get(url, timeout=60)
+    for item in decode_json(resp.content)["items"]:
+        on_record(decode_video(item))
+
+
+def streamed(url: str, on_record: Callable[[VideoRecord], None]) -> None:
+    with get_session().get(url, timeout=60, stream=True) as resp:
+        for item in iter_response_array(resp, "items", {}, STREAM_CHUNK_SIZE):
+            on_record(decode_video(item))
+
+
+def _run(fn, url: str) -> tuple:
+    records: List[VideoRecord] = []
+    first: List[float] = []
+
+    def on_record(record: VideoRecord) -> None:
+        if not first:
+            first.append(time.perf_counter() - started)
+        records.append(record)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    fn(url, on_record)
+    total = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return records, first[0], total, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare buffered and streamed decoding of a paced videos.list response."
+    )
+    parser.add_argument("--items", type=int, default=50)
+    parser.add_argument("--mbps", type=float, default=2.0, help="link speed in MB/s")
+    args = parser.parse_args()
+
+    failures = check()
+    body = json.dumps(make_payload(args.items)).encode()
+    server = _serve(body, args.mbps * 1e6)
+    url = f"http://127.0.0.1:{server.server_address[1]}/videos"
+    try:
+        get_session().get(url, timeout=60).close()  # warm the keep-alive connection
+        results = {fn.__name__: _run(fn, url) for fn in (buffered, streamed)}
+    finally:
+        server.shutdown()
+
+    assert results["buffered"][0] == results["streamed"][0]
+    print(f"{args.items} items, {len(body) / 1024:.0f} KiB body at {args.mbps:g} MB/s\n")
+    print(f"{'':<10}{'first record ms':>17}{'last record ms':>16}{'peak KiB':>10}")
+    for name, (_, first, total, peak) in results.items():
+        print(f"{name:<10}{first * 1e3:>17.1f}{total * 1e3:>16.1f}{peak / 1024:>10.0f}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
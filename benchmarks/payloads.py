@@ -0,0 +1,115 @@
+# benchmarks/payloads.py – synthetic videos.list responses shaped like the real API
+import random
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+_WORDS = (
+    "election minister parliament breaking live update president senate court "
+    "economy inflation protest summit war ceasefire report analysis interview "
+    "vote budget policy crisis border trade climate debate press conference"
+).split()
+
+_THUMB_SIZES = {
+    "default": (120, 90),
+    "medium": (320, 180),
+    "high": (480, 360),
+    "standard": (640, 480),
+    "maxres": (1280, 720),
+}
+
+_DURATIONS = ("PT45S", "PT59S", "PT1M10S", "PT3M12S", "PT8M", "PT12M45S", "PT1H2M3S", "P0D")
+
+
+def _sentence(rng: random.Random, n: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(n))
+
+
+def make_item(rng: random.Random, index: int, region_code: str = "US") -> dict:
+    """Return one full ``videos.list`` item with every part the API sends by default."""
+    vid = f"{region_code}{index:09d}"[:11]
+    title = _sentence(rng, rng.randint(6, 14)).title()
+    if index % 9 == 0:
+        title += " #shorts"
+    description = "\n".join(_sentence(rng, rng.randint(10, 40)) for _ in range(rng.randint(3, 25)))
+    stats = {
+        "viewCount": str(rng.randint(1_000, 50_000_000)),
+        "favoriteCount": "0",
+        "commentCount": str(rng.randint(0, 20_000)),
+    }
+    if index % 6:
+        stats["likeCount"] = str(rng.randint(0, 500_000))
+    return {
+        "kind": "youtube#video",
+        "etag": f"etag-{vid}",
+        "id": vid,
+        "snippet": {
+            "publishedAt": "2026-10-14T08:30:00Z",
+            "channelId": f"UC{vid}channel",
+            "title": title,
+            "description": description,
+            "thumbnails": {
+                size: {"url": f"https://i.ytimg.com/vi/{vid}/{size}.jpg", "width": w, "height": h}
+                for size, (w, h) in _THUMB_SIZES.items()
+            },
+            "channelTitle": f"{rng.choice(_WORDS).title()} News",
+            "tags": [rng.choice(_WORDS) for _ in range(rng.randint(5, 25))],
+            "categoryId": "25",
+            "liveBroadcastContent": "none",
+            "defaultAudioLanguage": "en",
+            "localized": {"title": title, "description": description},
+        },
+        "contentDetails": {
+            "duration": rng.choice(_DURATIONS),
+            "dimension": "2d",
+            "definition": "hd",
+            "caption": "false",
+            "licensedContent": True,
+            "contentRating": {},
+            "projection": "rectangular",
+        },
+        "statistics": stats,
+    }
+
+
+def make_payload(
+    n_items: int = 50,
+    region_code: str = "US",
+    seed: int = 0,
+    next_page_token: Optional[str] = None,
+) -> dict:
+    """Return a full (unprojected) ``videos.list`` response body."""
+    rng = random.Random(seed)
+    payload = {
+        "kind": "youtube#videoListResponse",
+        "etag": f"list-etag-{region_code}-{seed}",
+        "items": [make_item(rng, i, region_code) for i in range(n_items)],
+        "pageInfo": {"totalResults": 200, "resultsPerPage": n_items},
+    }
+    if next_page_token:
+        payload["nextPageToken"] = next_page_token
+    return payload
+
+
+def project(data, tree: Dict[str, dict]):
+    """Apply a field tree locally, mimicking the API's partial-response filter."""
+    if isinstance(data, list):
+        return [project(item, tree) for item in data]
+    if not isinstance(data, dict):
+        return data
+    out = {}
+    for name, children in tree.items():
+        if name in data:
+            out[name] = project(data[name], children) if children else data[name]
+    return out
+
+
+def best_of(fn: Callable[[], object], repeat: int = 5, number: int = 20) -> Tuple[float, object]:
+    """Return (best seconds per call, last result) over ``repeat`` rounds of ``number`` calls."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            result = fn()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best, result
@@ -0,0 +1,215 @@
+# news_dashboard – data layer for the Global News & Politics dashboard
+from .cache import (
+    FAILURE_COOLDOWN_SEC,
+    FRESH_TTL_SEC,
+    REFRESH_SCHEDULER,
+    REGION_CACHE,
+    REGION_FLIGHTS,
+    STALE_GRACE_SEC,
+    FetchFailure,
+    get_region_snapshot,
+    get_trending_news_for_region,
+    invalidate_region,
+    is_refreshing,
+    fetch_depth,
+    peek_region_snapshot,
+    publish_region,
+    read_region_snapshot,
+    refresh_region,
+    region_failure,
+    report_region_failure,
+    request_refresh,
+    slice_top,
+)
+from .engine import (
+    DEFAULT_MAX_WORKERS,
+    RegionResult,
+    fetch_regions,
+    fetch_regions_async,
+)
+from .fields import VIDEO_FIELDS, VIDEO_PARTS, build_fields_selector
+from .jsonlib import (
+    JSON_BACKEND,
+    configure_json_backend,
+    decode_json,
+    iter_json_array,
+    iter_response_array,
+    json_backend,
+)
+from .keys import (
+    KEY_POOL,
+    ApiKeyPool,
+    NoApiKeyAvailable,
+    configure_api_keys,
+    parse_api_keys,
+)
+from .quota import (
+    QUOTA_LEDGER,
+    QuotaBudgetExceeded,
+    QuotaLedger,
+    RefreshScheduler,
+)
+from .ranking import top_by_views, top_videos_and_shorts
+from .resilience import (
+    FETCH_BUDGET_SEC,
+    FETCH_ERRORS,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryPolicy,
+    breaker_stats,
+    describe_error,
+    get_breaker,
+    redact_keys,
+    send_with_retry,
+    send_with_retry_async,
+)
+from .schema import TEXT_DTYPE, VIDEO_DTYPES, apply_video_schema
+from .session import DEFAULT_POOL_SIZE, configure_session, get_session
+from .singleflight import SingleFlight
+from .store import (
+    QuotaUsageStore,
+    Snapshot,
+    SnapshotBackend,
+    SnapshotStore,
+    get_quota_store,
+    get_snapshot_store,
+)
+from .ttl import TTLCache
+from .worker import (
+    ASYNC_FETCH,
+    EXTERNAL_COLLECTOR,
+    PREWARM_ENABLED,
+    IngestionWorker,
+    start_background_worker,
+)
+from .youtube import (
+    API_KEY_HEADER,
+    DEFAULT_ASYNC_CONCURRENCY,
+    MAX_RESULTS_PER_PAGE,
+    MAX_TOTAL_RESULTS,
+    NEWS_CATEGORY_ID,
+    PAGE_VALIDATORS,
+    REGION_LABELS_BY_CODE,
+    SHORTS_MAX_DURATION_SEC,
+    STREAM_CHUNK_SIZE,
+    YOUTUBE_API_URL,
+    AsyncYouTubeClient,
+    Page,
+    VideoRecord,
+    decode_video,
+    decode_videos,
+    fetch_trending_news_for_region,
+    fetch_trending_news_for_region_async,
+    fetch_trending_news_paginated,
+    iter_trending_news_pages,
+    iter_trending_news_records,
+    mark_shorts,
+    normalize_videos,
+    parse_iso_duration,
+    parse_iso_durations,
+    records_to_frame,
+    sort_by_views,
+)
+
+__all__ = [
+    "API_KEY_HEADER",
+    "ASYNC_FETCH",
+    "ApiKeyPool",
+    "AsyncYouTubeClient",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "DEFAULT_ASYNC_CONCURRENCY",
+    "DEFAULT_MAX_WORKERS",
+    "DEFAULT_POOL_SIZE",
+    "EXTERNAL_COLLECTOR",
+    "FAILURE_COOLDOWN_SEC",
+    "FETCH_BUDGET_SEC",
+    "FETCH_ERRORS",
+    "FRESH_TTL_SEC",
+    "FetchFailure",
+    "IngestionWorker",
+    "JSON_BACKEND",
+    "KEY_POOL",
+    "MAX_RESULTS_PER_PAGE",
+    "MAX_TOTAL_RESULTS",
+    "NEWS_CATEGORY_ID",
+    "NoApiKeyAvailable",
+    "PAGE_VALIDATORS",
+    "PREWARM_ENABLED",
+    "Page",
+    "QUOTA_LEDGER",
+    "QuotaBudgetExceeded",
+    "QuotaLedger",
+    "QuotaUsageStore",
+    "REFRESH_SCHEDULER",
+    "REGION_CACHE",
+    "REGION_FLIGHTS",
+    "REGION_LABELS_BY_CODE",
+    "RefreshScheduler",
+    "RegionResult",
+    "RetryPolicy",
+    "SHORTS_MAX_DURATION_SEC",
+    "STALE_GRACE_SEC",
+    "STREAM_CHUNK_SIZE",
+    "SingleFlight",
+    "Snapshot",
+    "SnapshotBackend",
+    "SnapshotStore",
+    "TEXT_DTYPE",
+    "TTLCache",
+    "VIDEO_DTYPES",
+    "VIDEO_FIELDS",
+    "VIDEO_PARTS",
+    "VideoRecord",
+    "YOUTUBE_API_URL",
+    "apply_video_schema",
+    "breaker_stats",
+    "build_fields_selector",
+    "configure_api_keys",
+    "configure_json_backend",
+    "configure_session",
+    "decode_json",
+    "decode_video",
+    "decode_videos",
+    "describe_error",
+    "fetch_depth",
+    "fetch_regions",
+    "fetch_regions_async",
+    "fetch_trending_news_for_region",
+    "fetch_trending_news_for_region_async",
+    "fetch_trending_news_paginated",
+    "get_breaker",
+    "get_quota_store",
+    "get_region_snapshot",
+    "get_session",
+    "get_snapshot_store",
+    "get_trending_news_for_region",
+    "invalidate_region",
+    "is_refreshing",
+    "iter_json_array",
+    "iter_response_array",
+    "iter_trending_news_pages",
+    "iter_trending_news_records",
+    "json_backend",
+    "mark_shorts",
+    "normalize_videos",
+    "parse_api_keys",
+    "parse_iso_duration",
+    "parse_iso_durations",
+    "peek_region_snapshot",
+    "publish_region",
+    "read_region_snapshot",
+    "records_to_frame",
+    "redact_keys",
+    "refresh_region",
+    "region_failure",
+    "report_region_failure",
+    "request_refresh",
+    "send_with_retry",
+    "send_with_retry_async",
+    "slice_top",
+    "sort_by_views",
+    "start_background_worker",
+    "top_by_views",
+    "top_videos_and_shorts",
+]
@@ -0,0 +1,117 @@
+# news_dashboard/__main__.py – headless collector: `python -m news_dashboard collect`
+import argparse
+import logging
+import sys
+from typing import List, Optional
+
+from .keys import KEY_POOL
+from .store import get_snapshot_store
+from .worker import ASYNC_FETCH, IngestionWorker
+from .youtube import (
+    DEFAULT_ASYNC_CONCURRENCY,
+    MAX_RESULTS_PER_PAGE,
+    MAX_TOTAL_RESULTS,
+    REGION_LABELS_BY_CODE,
+)
+
+log = logging.getLogger("news_dashboard.collector")
+
+
+def _parse_args(argv: Optional[List[str]]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m news_dashboard",
+        description="Data collection for the Global News & Politics dashboard.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    collect = commands.add_parser(
+        "collect",
+        help="fetch every region on a schedule and publish snapshots to the shared store",
+        description=(
+            "Fetch trending News & Politics videos for every region and publish them to "
+            "the snapshot store (SQLite at YOUTUBE_SNAPSHOT_DB, or memory-mapped Arrow "
+            "files in YOUTUBE_SNAPSHOT_ARROW_DIR with YOUTUBE_SNAPSHOT_BACKEND=arrow). "
+            "Run one collector and start the Streamlit replicas with "
+            "YOUTUBE_EXTERNAL_COLLECTOR=1 so they only read. "
+            "API keys come from YOUTUBE_API_KEYS / YOUTUBE_API_KEY."
+        ),
+    )
+    collect.add_argument(
+        "--regions",
+        default=",".join(REGION_LABELS_BY_CODE),
+        help="comma-separated region codes (default: all dashboard regions)",
+    )
+    collect.add_argument(
+        "--max-results",
+        type=int,
+        default=MAX_RESULTS_PER_PAGE,
+        help=(
+            f"videos per region; {MAX_RESULTS_PER_PAGE} costs one unit, up to "
+            f"{MAX_TOTAL_RESULTS} pages through the chart (default: %(default)s)"
+        ),
+    )
+    collect.add_argument(
+        "--interval",
+        type=float,
+        default=None,
+        help="seconds between cycles (default: the quota-aware refresh interval)",
+    )
+    collect.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        default=ASYNC_FETCH,
+        help="fetch all regions and pages on one asyncio loop (needs aiohttp)",
+    )
+    collect.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_ASYNC_CONCURRENCY,
+        help="max requests in flight with --async (default: %(default)s)",
+    )
+    collect.add_argument(
+        "--once", action="store_true", help="run a single cycle and exit"
+    )
+    collect.add_argument("-v", "--verbose", action="store_true", help="debug logging")
+    return parser.parse_args(argv)
+
+
+def collect(args: argparse.Namespace) -> int:
+    if not len(KEY_POOL):
+        log.error("No YouTube API key configured (set YOUTUBE_API_KEYS or YOUTUBE_API_KEY)")
+        return 2
+    store = get_snapshot_store()
+    if store is None:
+        log.error("Snapshot store is disabled or unavailable (see YOUTUBE_SNAPSHOT_BACKEND)")
+        return 2
+    regions = [code.strip().upper() for code in args.regions.split(",") if code.strip()]
+    worker = IngestionWorker(
+        regions,
+        max_results=args.max_results,
+        interval=args.interval,
+        use_async=args.use_async,
+        concurrency=args.concurrency,
+    )
+    log.info("Collecting %s into %s", ", ".join(regions), store.path)
+    if args.once:
+        results = worker.run_once()
+        return 0 if any(r.ok for r in results.values()) else 1
+    try:
+        worker.run_forever()
+    except KeyboardInterrupt:
+        log.info("Collector stopped")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    if args.command == "collect":
+        return collect(args)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+# news_dashboard/arrow_store.py – memory-mapped Arrow IPC snapshots shared between processes
+import os
+import tempfile
+import time
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+
+from .store import DEFAULT_ARROW_DIR, Snapshot, SnapshotKey
+
+# Schema metadata key holding the snapshot's fetch time
+_FETCHED_AT = b"news_dashboard.fetched_at"
+
+
+def _frame_to_table(df: pd.DataFrame, fetched_at: float) -> pa.Table:
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_FETCHED_AT] = repr(fetched_at).encode()
+    return table.replace_schema_metadata(metadata)
+
+
+class ArrowSnapshotStore:
+    """
+    One Arrow IPC file per cache key, memory-mapped by every reader.
+
+    Readers wrap the mapped buffers as pandas columns without copying them
+    (strings stay Arrow-backed, numeric columns become views; only boolean
+    columns are unpacked), so N replicas share one copy of each snapshot
+    through the OS page cache instead of holding N private copies.
+
+    Writers build the new file under a temporary name in the same directory
+    and ``os.replace`` it over the old one. Readers therefore see either the
+    previous or the new snapshot, never a partial file, and mappings of the
+    previous file stay valid until they are dropped.
+
+    Same interface as ``SnapshotStore``.
+    """
+
+    def __init__(self, directory: str = DEFAULT_ARROW_DIR) -> None:
+        self.path = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _file(self, key: SnapshotKey) -> str:
+        region_code, category_id, max_results = key
+        return os.path.join(self.path, f"{region_code}-{category_id}-{max_results}.arrow")
+
+    def _map(self, key: SnapshotKey) -> Optional[pa.MemoryMappedFile]:
+        try:
+            return pa.memory_map(self._file(key), "r")
+        except FileNotFoundError:
+            return None
+
+    def fetched_at(self, key: SnapshotKey) -> Optional[float]:
+        """Publication time of the stored snapshot (reads only the file footer)."""
+        source = self._map(key)
+        if source is None:
+            return None
+        with source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+        return float(metadata.get(_FETCHED_AT, b"0"))
+
+    def load(self, key: SnapshotKey) -> Optional[Snapshot]:
+        source = self._map(key)
+        if source is None:
+            return None
+        # The mapping is left open: the returned frame's columns point into it,
+        # and it is released once the last of them is garbage-collected.
+        table = pa.ipc.open_file(source).read_all()
+        fetched_at = float((table.schema.metadata or {}).get(_FETCHED_AT, b"0"))
+        if table.num_columns == 0:
+            return Snapshot(pd.DataFrame(), fetched_at)
+        return Snapshot(table.to_pandas(split_blocks=True), fetched_at)
+
+    def save(self, key: SnapshotKey, df: pd.DataFrame, fetched_at: Optional[float] = None) -> None:
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        table = _frame_to_table(df, fetched_at)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".arrow.tmp")
+        try:
+            with os.fdopen(fd, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+                sink.flush()
+                os.fsync(sink.fileno())
+            os.replace(tmp_path, self._file(key))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def delete(self, key: SnapshotKey) -> None:
+        try:
+            os.unlink(self._file(key))
+        except FileNotFoundError:
+            pass
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,399 @@
+# news_dashboard/cache.py – process-wide TTL/LRU cache for region frames
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import pandas as pd
+
+from .quota import QUOTA_LEDGER, RefreshScheduler
+from .resilience import FETCH_ERRORS, describe_error
+from .singleflight import SingleFlight
+from .store import STORE_ERRORS, Snapshot, SnapshotKey, get_snapshot_store
+from .ttl import DEFAULT_TTL_SEC, TTLCache
+from .youtube import (
+    MAX_RESULTS_PER_PAGE,
+    MAX_TOTAL_RESULTS,
+    NEWS_CATEGORY_ID,
+    fetch_trending_news_for_region,
+    fetch_trending_news_paginated,
+)
+
+log = logging.getLogger(__name__)
+
+# Data younger than this is served without touching the network. The quota
+# scheduler may stretch the effective interval when the daily budget runs low.
+FRESH_TTL_SEC = DEFAULT_TTL_SEC
+REFRESH_SCHEDULER = RefreshScheduler(QUOTA_LEDGER, FRESH_TTL_SEC)
+
+# Past the refresh interval a cached region is stale; within the grace window
+# it is still served instantly while a background refresh runs, after that
+# the next reader waits for a fresh fetch.
+STALE_GRACE_SEC = float(os.getenv("YOUTUBE_CACHE_STALE_GRACE_SEC", "900"))
+
+# After a failed fetch, background refreshes of that key (page reruns, stale
+# reads) wait this long before trying again; explicit refreshes do not
+FAILURE_COOLDOWN_SEC = float(os.getenv("YOUTUBE_FAILURE_COOLDOWN_SEC", "120"))
+
+# Shared by every Streamlit session in the process (module state survives reruns).
+# Holds Snapshot objects so callers can show how old the data is; freshness is
+# decided by _get_snapshot, the cache itself only bounds the number of entries.
+REGION_CACHE = TTLCache(ttl=float("inf"))
+
+
+def _cache_key(
+    region_code: str, category_id: str, max_results: int = MAX_RESULTS_PER_PAGE
+) -> SnapshotKey:
+    return (region_code, category_id, max_results)
+
+
+def fetch_depth(max_results: int) -> int:
+    """Number of videos to fetch so that ``max_results`` can be sliced locally."""
+    if max_results <= MAX_RESULTS_PER_PAGE:
+        return MAX_RESULTS_PER_PAGE
+    return max(max_results, MAX_TOTAL_RESULTS)
+
+
+def slice_top(df: pd.DataFrame, max_results: int) -> pd.DataFrame:
+    """
+    Return the rows a ``maxResults=max_results`` request would have produced.
+
+    The API fills smaller pages from the top of the trending chart, so rows are
+    picked by ``trending_rank`` and keep their view-count order.
+    """
+    if df.empty or max_results >= len(df):
+        return df
+    if "trending_rank" in df.columns:
+        top = df[df["trending_rank"] <= max_results]
+    else:
+        top = df.head(max_results)
+    return top.reset_index(drop=True)
+
+
+@dataclass
+class FetchFailure:
+    """The error of a key's latest fetch, kept until a fetch of it succeeds."""
+
+    error: BaseException
+    failed_at: float
+
+    @property
+    def age_sec(self) -> float:
+        return max(0.0, time.time() - self.failed_at)
+
+
+_failures: Dict[SnapshotKey, FetchFailure] = {}
+_failures_lock = threading.Lock()
+
+
+def _note_failure(key: SnapshotKey, error: BaseException) -> None:
+    with _failures_lock:
+        _failures[key] = FetchFailure(error, time.time())
+
+
+def _last_failure(key: SnapshotKey) -> Optional[FetchFailure]:
+    with _failures_lock:
+        return _failures.get(key)
+
+
+def _fetch_and_store(key: SnapshotKey, api_key: Optional[str]) -> Snapshot:
+    region_code, category_id, max_results = key
+    try:
+        if max_results <= MAX_RESULTS_PER_PAGE:
+            df = fetch_trending_news_for_region(
+                region_code, max_results, api_key=api_key, category_id=category_id
+            )
+        else:
+            df = fetch_trending_news_paginated(
+                region_code, max_results, api_key=api_key, category_id=category_id
+            )
+    except Exception as exc:
+        _note_failure(key, exc)
+        raise
+    return _publish(key, df)
+
+
+def _publish(key: SnapshotKey, df: pd.DataFrame) -> Snapshot:
+    max_results = key[2]
+    snapshot = Snapshot(df, time.time())
+    REGION_CACHE.set(key, snapshot)
+    with _failures_lock:
+        _failures.pop(key, None)
+    REFRESH_SCHEDULER.note_refresh(key, -(-max_results // MAX_RESULTS_PER_PAGE))
+    store = get_snapshot_store()
+    if store is not None:
+        try:
+            store.save(key, df, fetched_at=snapshot.fetched_at)
+        except STORE_ERRORS as exc:
+            log.warning("Could not persist snapshot %s: %s", key, exc)
+    return snapshot
+
+
+# One in-flight fetch per cache key, shared by every session and refresh thread
+REGION_FLIGHTS = SingleFlight()
+
+
+def _fetch_shared(key: SnapshotKey, api_key: Optional[str]) -> Snapshot:
+    """Fetch ``key``, joining an identical fetch if one is already running."""
+    return REGION_FLIGHTS.do(key, lambda: _fetch_and_store(key, api_key))
+
+
+def _refresh_in_background(
+    key: SnapshotKey, api_key: Optional[str], force: bool = False
+) -> None:
+    """
+    Refetch ``key`` on a daemon thread unless a fetch is already running or,
+    without ``force``, its last fetch failed less than ``FAILURE_COOLDOWN_SEC`` ago.
+    """
+    if REGION_FLIGHTS.in_flight(key):
+        return
+    failure = _last_failure(key)
+    if not force and failure is not None and failure.age_sec < FAILURE_COOLDOWN_SEC:
+        return
+
+    def run() -> None:
+        try:
+            _fetch_shared(key, api_key)
+        except FETCH_ERRORS as exc:
+            log.warning("Background refresh failed for %s: %s", key, describe_error(exc))
+        except Exception:
+            log.exception("Background refresh failed for %s", key)
+
+    threading.Thread(target=run, name=f"refresh-{key[0]}", daemon=True).start()
+
+
+def is_refreshing(
+    region_code: str,
+    max_results: int = MAX_RESULTS_PER_PAGE,
+    category_id: str = NEWS_CATEGORY_ID,
+) -> bool:
+    """True while a fetch for this region is in flight."""
+    key = _cache_key(region_code, category_id, fetch_depth(max_results))
+    return REGION_FLIGHTS.in_flight(key)
+
+
+def _load_snapshot(key: SnapshotKey) -> Optional[Snapshot]:
+    store = get_snapshot_store()
+    if store is None:
+        return None
+    try:
+        return store.load(key)
+    except STORE_ERRORS as exc:
+        log.warning("Could not read snapshot %s: %s", key, exc)
+        return None
+
+
+def _cached_snapshot(key: SnapshotKey) -> Tuple[Optional[Snapshot], bool]:
+    """Return ``(snapshot, from_disk)`` from memory, else from the disk store."""
+    snapshot = REGION_CACHE.get(key)
+    if snapshot is not None:
+        return snapshot, False
+    snapshot = _load_snapshot(key)
+    if snapshot is not None:
+        REGION_CACHE.set(key, snapshot)
+    return snapshot, True
+
+
+def _get_snapshot(key: SnapshotKey, api_key: Optional[str]) -> Snapshot:
+    snapshot, from_disk = _cached_snapshot(key)
+    if snapshot is None:
+        return _fetch_shared(key, api_key)
+
+    interval = REFRESH_SCHEDULER.refresh_interval()
+    if snapshot.age_sec <= interval:
+        return snapshot
+    if from_disk or snapshot.age_sec <= interval + STALE_GRACE_SEC:
+        # Disk snapshots (typically after a restart) are served whatever their age
+        _refresh_in_background(key, api_key)
+        return snapshot
+    try:
+        return _fetch_shared(key, api_key)
+    except FETCH_ERRORS as exc:
+        # Quota gone, breaker open or API failing: old data beats no data
+        log.warning("Serving stale %s: %s", key, describe_error(exc))
+        return snapshot
+
+
+def get_region_snapshot(
+    region_code: str,
+    max_results: int = MAX_RESULTS_PER_PAGE,
+    api_key: Optional[str] = None,
+    category_id: str = NEWS_CATEGORY_ID,
+) -> Snapshot:
+    """
+    Cached front for ``fetch_trending_news_for_region`` (stale-while-revalidate).
+
+    The API is always asked for a full page of ``MAX_RESULTS_PER_PAGE`` videos
+    and smaller ``max_results`` values are served by slicing that frame, so
+    changing the slider never triggers a request. Values above one page fetch
+    ``MAX_TOTAL_RESULTS`` videos via ``nextPageToken`` and slice those instead.
+
+    Lookup order is the in-memory ``REGION_CACHE``, then the on-disk snapshot
+    store, then the API. Data younger than the refresh interval (the TTL,
+    stretched by ``REFRESH_SCHEDULER`` when quota runs low) is returned as-is.
+    Older data (up to ``STALE_GRACE_SEC`` past the interval in memory, any age
+    on disk after a restart) is returned immediately while a background
+    thread refetches it, so only a region never seen before blocks on the
+    network. A blocking refetch retries within ``FETCH_BUDGET_SEC``; if it
+    fails (quota, open circuit breaker, API errors) the old snapshot is
+    served instead.
+    Concurrent callers for the same region share a single in-flight request.
+    The returned frame is shared between callers and must be treated as
+    read-only; ``fetched_at`` tells how old it is.
+    """
+    key = _cache_key(region_code, category_id, fetch_depth(max_results))
+    snapshot = _get_snapshot(key, api_key)
+    return Snapshot(slice_top(snapshot.df, max_results), snapshot.fetched_at)
+
+
+def peek_region_snapshot(
+    region_code: str,
+    max_results: int = MAX_RESULTS_PER_PAGE,
+    category_id: str = NEWS_CATEGORY_ID,
+) -> Optional[Snapshot]:
+    """
+    Non-blocking read of the cached snapshot for a region (memory, then disk).
+
+    Never waits on the network: a missing or stale entry only schedules a
+    background fetch, and ``None`` is returned when nothing is cached yet.
+    A region whose last fetch failed is not refetched until
+    ``FAILURE_COOLDOWN_SEC`` has passed; ``region_failure`` tells why.
+    """
+    key = _cache_key(region_code, category_id, fetch_depth(max_results))
+    snapshot, _ = _cached_snapshot(key)
+    if snapshot is None or snapshot.age_sec > REFRESH_SCHEDULER.refresh_interval():
+        _refresh_in_background(key, None)
+    if snapshot is None:
+        return None
+    return Snapshot(slice_top(snapshot.df, max_results), snapshot.fetched_at)
+
+
+def region_failure(
+    region_code: str,
+    max_results: int = MAX_RESULTS_PER_PAGE,
+    category_id: str = NEWS_CATEGORY_ID,
+) -> Optional[FetchFailure]:
+    """The error of the region's latest fetch in this process, or None if it succeeded."""
+    return _last_failure(_cache_key(region_code, category_id, fetch_depth(max_results)))
+
+
+def report_region_failure(
+    region_code: str,
+    error: BaseException,
+    max_results: int = MAX_RESULTS_PER_PAGE,
+    category_id: str = NEWS_CATEGORY_ID,
+) -> None:
+    """Record a failed fetch made elsewhere (e.g. the async client), like ``publish_region``."""
+    _note_failure(_cache_key(region_code, category_id, fetch_depth(max_results)), error)
+
+
+def _published_snapshot(key: SnapshotKey) -> Optional[Snapshot]:
+    store = get_snapshot_store()
+    if store is None:
+        return None
+    cached = REGION_CACHE.get(key)
+    try:
+        published_at = store.fetched_at(key)
+    except STORE_ERRORS as exc:
+        log.warning("Could not read snapshot %s: %s", key, exc)
+        return cached
+    if published_at is None:
+        return None
+    if cached is not None and cached.fetched_at >= published_at:
+        return cached
+    snapshot = _load_snapshot(key)
+    if snapshot is not None:
+        REGION_CACHE.set(key, snapshot)
+    return snapshot
+
+
+def read_region_snapshot(
+    region_code: str,
+    max_results: int = MAX_RESULTS_PER_PAGE,
+    category_id: str = NEWS_CATEGORY_ID,
+) -> Optional[Snapshot]:
+    """
+    Store-only read of the latest snapshot published by an external collector.
+
+    Never calls the API and never schedules a fetch. The decoded frame is kept
+    in ``REGION_CACHE`` and only reloaded once the collector publishes a newer
+    one. If the collector did not fetch at the matching depth, the snapshot
+    of the other depth is sliced instead (a 50-video page may then return
+    fewer rows than asked for). Returns ``None`` when nothing is published yet.
+    """
+    cap = fetch_depth(max_results)
+    caps = [cap] + [c for c in (MAX_TOTAL_RESULTS, MAX_RESULTS_PER_PAGE) if c != cap]
+    for fetch_cap in caps:
+        snapshot = _published_snapshot(_cache_key(region_code, category_id, fetch_cap))
+        if snapshot is not None:
+            return Snapshot(slice_top(snapshot.df, max_results), snapshot.fetched_at)
+    return None
+
+
+def refresh_region(
+    region_code: str,
+    max_results: int = MAX_RESULTS_PER_PAGE,
+    api_key: Optional[str] = None,
+    category_id: str = NEWS_CATEGORY_ID,
+) -> Snapshot:
+    """Fetch a region now (joining any in-flight fetch) and publish it to the caches."""
+    key = _cache_key(region_code, category_id, fetch_depth(max_results))
+    return _fetch_shared(key, api_key)
+
+
+def publish_region(
+    region_code: str,
+    df: pd.DataFrame,
+    max_results: int = MAX_RESULTS_PER_PAGE,
+    category_id: str = NEWS_CATEGORY_ID,
+) -> Snapshot:
+    """
+    Publish a frame fetched elsewhere (e.g. the async client) as the region's snapshot.
+
+    ``df`` must hold ``fetch_depth(max_results)`` videos, as ``refresh_region``
+    would have fetched; it goes to the cache, the refresh scheduler and the
+    disk store exactly like a regular fetch.
+    """
+    return _publish(_cache_key(region_code, category_id, fetch_depth(max_results)), df)
+
+
+def request_refresh(
+    region_code: str,
+    max_results: int = MAX_RESULTS_PER_PAGE,
+    category_id: str = NEWS_CATEGORY_ID,
+) -> None:
+    """
+    Schedule a background refetch of a region, keeping the cached copy meanwhile.
+
+    Unlike automatic refreshes this ignores ``FAILURE_COOLDOWN_SEC``.
+    """
+    key = _cache_key(region_code, category_id, fetch_depth(max_results))
+    _refresh_in_background(key, None, force=True)
+
+
+def get_trending_news_for_region(
+    region_code: str,
+    max_results: int = MAX_RESULTS_PER_PAGE,
+    api_key: Optional[str] = None,
+    category_id: str = NEWS_CATEGORY_ID,
+) -> pd.DataFrame:
+    """Frame-only variant of ``get_region_snapshot``."""
+    return get_region_snapshot(region_code, max_results, api_key, category_id).df
+
+
+def invalidate_region(
+    region_code: str,
+    max_results: int = MAX_RESULTS_PER_PAGE,
+    category_id: str = NEWS_CATEGORY_ID,
+) -> bool:
+    """Forget the cached frame (memory and disk) so the next read refetches it."""
+    key = _cache_key(region_code, category_id, fetch_depth(max_results))
+    store = get_snapshot_store()
+    if store is not None:
+        try:
+            store.delete(key)
+        except STORE_ERRORS as exc:
+            log.warning("Could not delete snapshot %s: %s", key, exc)
+    return REGION_CACHE.invalidate(key)
@@ -0,0 +1,107 @@
+# news_dashboard/engine.py – concurrent multi-region fetching
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional
+
+import pandas as pd
+
+from .cache import get_trending_news_for_region
+from .youtube import DEFAULT_ASYNC_CONCURRENCY, MAX_RESULTS_PER_PAGE, AsyncYouTubeClient
+
+# Upper bound on simultaneous region requests issued by one fetch_regions() call
+DEFAULT_MAX_WORKERS = 8
+
+
+@dataclass
+class RegionResult:
+    """Outcome of fetching one region: a frame on success, an exception otherwise."""
+
+    region_code: str
+    df: pd.DataFrame
+    error: Optional[BaseException] = None
+    elapsed_sec: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _timed_fetch(
+    fetch: Callable[..., pd.DataFrame], region_code: str, **kwargs
+) -> RegionResult:
+    started = time.perf_counter()
+    try:
+        df = fetch(region_code, **kwargs)
+        return RegionResult(region_code, df, elapsed_sec=time.perf_counter() - started)
+    except Exception as exc:  # one bad region must not sink the others
+        return RegionResult(
+            region_code, pd.DataFrame(), exc, elapsed_sec=time.perf_counter() - started
+        )
+
+
+def fetch_regions(
+    region_codes: Iterable[str],
+    max_results: int = MAX_RESULTS_PER_PAGE,
+    api_key: Optional[str] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    fetch: Callable[..., pd.DataFrame] = get_trending_news_for_region,
+) -> Dict[str, RegionResult]:
+    """
+    Fetch several regions concurrently and return ``{region_code: RegionResult}``.
+
+    All requests are issued at once (up to ``max_workers`` in flight), so the
+    total latency tracks the slowest region rather than the sum of all of them.
+    Regions are read through the shared cache by default. Errors are captured
+    per region instead of being raised. The returned dict preserves the order
+    of ``region_codes``; duplicates are fetched once.
+    """
+    codes = list(dict.fromkeys(region_codes))
+    if not codes:
+        return {}
+
+    workers = max(1, min(max_workers, len(codes)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="region-fetch") as pool:
+        futures = {
+            code: pool.submit(
+                _timed_fetch, fetch, code, max_results=max_results, api_key=api_key
+            )
+            for code in codes
+        }
+        return {code: futures[code].result() for code in codes}
+
+
+async def fetch_regions_async(
+    region_codes: Iterable[str],
+    max_results: int = MAX_RESULTS_PER_PAGE,
+    api_key: Optional[str] = None,
+    concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+) -> Dict[str, RegionResult]:
+    """
+    asyncio variant of ``fetch_regions``, straight from the API (no cache).
+
+    Every region, and every page of every region when ``max_results`` is
+    above one page, runs on the current event loop through one
+    ``AsyncYouTubeClient``, capped at ``concurrency`` requests in flight.
+    Same result shape and error capture as ``fetch_regions``; publish the
+    frames with ``publish_region`` to make them visible to readers.
+    """
+    codes = list(dict.fromkeys(region_codes))
+    if not codes:
+        return {}
+
+    async with AsyncYouTubeClient(concurrency) as client:
+
+        async def one(code: str) -> RegionResult:
+            started = time.perf_counter()
+            try:
+                df = await client.fetch_region(code, max_results, api_key=api_key)
+                return RegionResult(code, df, elapsed_sec=time.perf_counter() - started)
+            except Exception as exc:  # one bad region must not sink the others
+                return RegionResult(
+                    code, pd.DataFrame(), exc, elapsed_sec=time.perf_counter() - started
+                )
+
+        results = await asyncio.gather(*(one(code) for code in codes))
+    return dict(zip(codes, results))
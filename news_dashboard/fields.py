@@ -0,0 +1,70 @@
+# news_dashboard/fields.py – partial-response `fields=` selectors for videos.list
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Thumbnail size requested from the API (the card renders one image)
+THUMBNAIL_SIZE = "medium"
+
+# API paths under each `items[]` entry that feed each normalized column
+COLUMN_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "video_id": ("id",),
+    "url": ("id",),
+    "title": ("snippet/title",),
+    "description": ("snippet/description",),
+    "channel_title": ("snippet/channelTitle",),
+    "published_at": ("snippet/publishedAt",),
+    "thumbnail_url": (f"snippet/thumbnails/{THUMBNAIL_SIZE}/url",),
+    "view_count": ("statistics/viewCount",),
+    "like_count": ("statistics/likeCount",),
+    "duration_sec": ("contentDetails/duration",),
+    "is_short": ("snippet/title", "snippet/description", "contentDetails/duration"),
+}
+
+# Response-level fields needed besides `items` (paging)
+ENVELOPE_FIELDS = ("nextPageToken",)
+
+FieldTree = Dict[str, "FieldTree"]
+
+
+def field_tree(columns: Optional[Iterable[str]] = None) -> FieldTree:
+    """Return the nested field tree required to build ``columns`` (default: all)."""
+    tree: FieldTree = {}
+    for column in columns if columns is not None else COLUMN_FIELDS:
+        for path in COLUMN_FIELDS[column]:
+            node = tree
+            for part in path.split("/"):
+                node = node.setdefault(part, {})
+    return tree
+
+
+def _render(tree: FieldTree) -> str:
+    parts: List[str] = []
+    for name, children in tree.items():
+        if not children:
+            parts.append(name)
+        elif len(children) == 1:
+            parts.append(f"{name}/{_render(children)}")
+        else:
+            parts.append(f"{name}({_render(children)})")
+    return ",".join(parts)
+
+
+def build_fields_selector(columns: Optional[Iterable[str]] = None) -> str:
+    """
+    Build a ``fields=`` partial-response selector for ``videos.list``.
+
+    Only the item paths that feed ``columns`` are requested, e.g.
+    ``items(id,snippet(title,...),statistics(viewCount,likeCount),
+    contentDetails/duration),nextPageToken``. Everything else (localized
+    copies, tags, other thumbnail sizes, ...) is dropped server-side.
+    """
+    return ",".join([f"items({_render(field_tree(columns))})", *ENVELOPE_FIELDS])
+
+
+def parts_for_fields(columns: Optional[Iterable[str]] = None) -> str:
+    """Return the ``part=`` value covering the resource parts ``columns`` read."""
+    return ",".join(name for name in field_tree(columns) if name != "id")
+
+
+# Selector used for every dashboard fetch
+VIDEO_FIELDS = build_fields_selector()
+VIDEO_PARTS = parts_for_fields()
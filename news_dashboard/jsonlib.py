@@ -0,0 +1,213 @@
+# news_dashboard/jsonlib.py – pluggable JSON decoding and incremental parsing of API responses
+import codecs
+import json
+import logging
+import os
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, Union
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # optional: the stdlib decoder is the fallback
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+# "auto" uses the fastest installed decoder; "orjson" or "stdlib" force one
+JSON_BACKEND = os.getenv("YOUTUBE_JSON_BACKEND", "auto").strip().lower()
+
+# Installed decoders by name. Each takes UTF-8 bytes or str.
+JSON_DECODERS: Dict[str, Callable[[Union[bytes, str]], Any]] = {"stdlib": json.loads}
+if orjson is not None:
+    JSON_DECODERS["orjson"] = orjson.loads
+
+_backend = "stdlib"
+_loads: Callable[[Union[bytes, str]], Any] = json.loads
+
+
+def configure_json_backend(name: str = JSON_BACKEND) -> str:
+    """
+    Select the decoder behind ``loads`` / ``decode_json`` and return its name.
+
+    An unknown or uninstalled backend falls back to stdlib with a warning, so
+    a missing optional package never breaks fetching.
+    """
+    global _backend, _loads
+    name = name.strip().lower()
+    if name == "auto":
+        name = "orjson" if "orjson" in JSON_DECODERS else "stdlib"
+    elif name not in JSON_DECODERS:
+        log.warning("JSON backend %r is not installed, using stdlib", name)
+        name = "stdlib"
+    _backend, _loads = name, JSON_DECODERS[name]
+    return name
+
+
+def json_backend() -> str:
+    """Return the name of the decoder currently in use."""
+    return _backend
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON document with the configured backend."""
+    return _loads(data)
+
+
+def decode_json(body: bytes) -> Any:
+    """
+    Decode an HTTP response body, as a drop-in for ``resp.json()``.
+
+    Decoding errors are raised as ``requests.JSONDecodeError``, like
+    ``resp.json()`` does, so malformed bodies stay within ``FETCH_ERRORS``
+    whichever backend is active.
+    """
+    try:
+        return _loads(body)
+    except ValueError as exc:  # orjson's and stdlib's JSONDecodeError, or bad UTF-8
+        raise _requests_error(exc) from exc
+
+
+def _requests_error(exc: ValueError) -> requests.JSONDecodeError:
+    return requests.JSONDecodeError(
+        getattr(exc, "msg", str(exc)), getattr(exc, "doc", ""), getattr(exc, "pos", 0)
+    )
+
+
+# ----------------- INCREMENTAL PARSING -------------------
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DECODER = json.JSONDecoder()
+
+# Characters that may follow a complete number inside an object or array
+_NUMBER_END = frozenset(",]} \t\n\r")
+
+
+class _ChunkReader:
+    """
+    Cursor over text decoded from a stream of byte chunks.
+
+    Only the unconsumed tail is kept in ``buf``; more input is read when a
+    value cannot be decoded from what has arrived so far.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Append the next non-empty piece of text; False once the input is exhausted."""
+        if self.eof:
+            return False
+        for chunk in self._chunks:
+            # A chunk can end inside a multi-byte character; the decoder holds it back
+            text = self._utf8.decode(chunk)
+            if text:
+                break
+        else:
+            text = self._utf8.decode(b"", final=True)
+            self.eof = True
+        self.buf = self.buf[self.pos:] + text
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character without consuming it, '' at end of input."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume and return the next character, which must be one of ``chars``."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(f"Expecting one of {chars!r}", self.buf, self.pos)
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Decode one complete JSON value, reading more input until it is whole."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # Truncated so far; only an error once there is nothing left to read
+                if not self._fill():
+                    raise
+                continue
+            # A number not followed by a delimiter may continue in the next chunk:
+            # raw_decode takes "1." or "-4e" as 1 and -4 and stops before the rest
+            if (
+                type(obj) in (int, float)
+                and (end == len(self.buf) or self.buf[end] not in _NUMBER_END)
+                and self._fill()
+            ):
+                continue
+            self.pos = end
+            return obj
+
+
+def iter_json_array(
+    chunks: Iterable[bytes], key: str, envelope: Dict[str, Any]
+) -> Iterator[Any]:
+    """
+    Yield the elements of the top-level array ``key`` as their bytes arrive.
+
+    ``chunks`` is the UTF-8 body of a JSON object, e.g. ``resp.iter_content()``.
+    Each element is decoded as soon as it is complete, so only one element
+    (plus one chunk) is buffered at a time. Other top-level members are
+    stored in ``envelope``; those after the array are only there once the
+    generator is exhausted. Malformed input raises ``json.JSONDecodeError``.
+
+    Elements go through the stdlib decoder's ``raw_decode``, which can stop
+    at the end of a value; the configured backend only decodes whole documents.
+    """
+    reader = _ChunkReader(chunks)
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.pos += 1
+    else:
+        while True:
+            name = reader.value()
+            if not isinstance(name, str):
+                raise json.JSONDecodeError("Expecting property name", reader.buf, reader.pos)
+            reader.expect(":")
+            if name == key and reader.peek() == "[":
+                reader.pos += 1
+                if reader.peek() == "]":
+                    reader.pos += 1
+                else:
+                    while True:
+                        yield reader.value()
+                        if reader.expect(",]") == "]":
+                            break
+            else:
+                envelope[name] = reader.value()
+            if reader.expect(",}") == "}":
+                break
+    if reader.peek():
+        raise json.JSONDecodeError("Extra data", reader.buf, reader.pos)
+
+
+def iter_response_array(
+    resp: requests.Response, key: str, envelope: Dict[str, Any], chunk_size: int
+) -> Iterator[Any]:
+    """
+    Streaming counterpart of ``decode_json``: ``iter_json_array`` over a
+    ``stream=True`` response, with errors raised as ``requests.JSONDecodeError``.
+    """
+    try:
+        yield from iter_json_array(resp.iter_content(chunk_size), key, envelope)
+    except ValueError as exc:  # JSONDecodeError, or bad UTF-8
+        raise _requests_error(exc) from exc
+
+
+configure_json_backend()
@@ -0,0 +1,160 @@
+# news_dashboard/keys.py – pool of YouTube API keys with weighted rotation
+import os
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Union
+
+from .quota import (
+    DAILY_QUOTA_UNITS,
+    QUOTA_LEDGER,
+    QuotaBudgetExceeded,
+    QuotaLedger,
+    key_label,
+)
+
+# Error reasons that mean "this key is out of quota for the day"
+DAILY_QUOTA_REASONS = frozenset({"quotaExceeded", "dailyLimitExceeded"})
+# Error reasons that mean "slow down"; the key recovers after a short pause
+RATE_LIMIT_REASONS = frozenset({"rateLimitExceeded", "userRateLimitExceeded"})
+
+RATE_LIMIT_COOLDOWN_SEC = float(os.getenv("YOUTUBE_KEY_RATE_LIMIT_COOLDOWN_SEC", "60"))
+
+
+class NoApiKeyAvailable(QuotaBudgetExceeded):
+    """Every key in the pool is cooling down or has spent its daily quota."""
+
+
+def parse_api_keys(value: Union[str, Iterable[str], None]) -> Dict[str, int]:
+    """
+    Parse ``"KEY_A:3, KEY_B"`` (or a list of such entries) into ``{key: weight}``.
+
+    Weights default to 1; duplicate keys keep the last weight.
+    """
+    if not value:
+        return {}
+    entries = value.split(",") if isinstance(value, str) else list(value)
+    keys: Dict[str, int] = {}
+    for entry in entries:
+        entry = str(entry).strip()
+        if not entry:
+            continue
+        key, _, weight = entry.partition(":")
+        keys[key.strip()] = max(1, int(weight)) if weight.strip() else 1
+    return keys
+
+
+class ApiKeyPool:
+    """
+    Thread-safe smooth weighted round-robin over API keys.
+
+    Each key has its own project quota (``per_key_quota`` units per day, as
+    tracked by the ledger). Keys that hit that quota, or that the API
+    reports as out of quota or rate-limited, are cooled down and skipped
+    until they recover.
+    """
+
+    def __init__(
+        self,
+        keys: Optional[Mapping[str, int]] = None,
+        ledger: QuotaLedger = QUOTA_LEDGER,
+        per_key_quota: int = DAILY_QUOTA_UNITS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ledger = ledger
+        self.per_key_quota = per_key_quota
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._weights: Dict[str, int] = {}
+        self._current: Dict[str, int] = {}
+        self._cooldown_until: Dict[str, float] = {}
+        self.set_keys(keys or {})
+
+    def set_keys(self, keys: Mapping[str, int]) -> None:
+        with self._lock:
+            if dict(keys) == self._weights:
+                return
+            self._weights = dict(keys)
+            self._current = {key: 0 for key in keys}
+            self._cooldown_until = {
+                k: v for k, v in self._cooldown_until.items() if k in keys
+            }
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    def _available(self, key: str, now: float) -> bool:
+        if self._cooldown_until.get(key, 0.0) > now:
+            return False
+        return self.ledger.spent_by_key(key) < self.per_key_quota
+
+    def acquire(self) -> str:
+        """Return the next key to use, or raise ``NoApiKeyAvailable``."""
+        now = self._clock()
+        with self._lock:
+            if not self._weights:
+                raise RuntimeError("No YouTube API key configured")
+            candidates = [k for k in self._weights if self._available(k, now)]
+            if not candidates:
+                raise NoApiKeyAvailable("All YouTube API keys are out of quota or cooling down")
+            total = 0
+            for key in candidates:
+                self._current[key] += self._weights[key]
+                total += self._weights[key]
+            best = max(candidates, key=self._current.__getitem__)
+            self._current[best] -= total
+            return best
+
+    def cool_down(self, key: str, seconds: float) -> None:
+        with self._lock:
+            if key in self._weights:
+                self._cooldown_until[key] = max(
+                    self._cooldown_until.get(key, 0.0), self._clock() + seconds
+                )
+
+    def report_error(self, key: str, reason: str) -> bool:
+        """Cool ``key`` down for a quota/rate-limit ``reason``; return True if it was one."""
+        if reason in DAILY_QUOTA_REASONS:
+            self.cool_down(key, self.ledger.seconds_until_reset())
+            return True
+        if reason in RATE_LIMIT_REASONS:
+            self.cool_down(key, RATE_LIMIT_COOLDOWN_SEC)
+            return True
+        return False
+
+    def status(self) -> List[Dict[str, object]]:
+        """Per-key weight, spend and cooldown, for debug panels (keys are masked)."""
+        now = self._clock()
+        with self._lock:
+            return [
+                {
+                    "key": key_label(key),
+                    "weight": weight,
+                    "spent_today": self.ledger.spent_by_key(key),
+                    "cooldown_sec": max(0, int(self._cooldown_until.get(key, 0.0) - now)),
+                }
+                for key, weight in self._weights.items()
+            ]
+
+
+def _keys_from_env() -> Dict[str, int]:
+    return parse_api_keys(os.getenv("YOUTUBE_API_KEYS") or os.getenv("YOUTUBE_API_KEY"))
+
+
+def _scale_budget(pool: ApiKeyPool) -> None:
+    # Unless YOUTUBE_DAILY_BUDGET is set explicitly, each key adds one
+    # project's daily quota to the app-wide budget.
+    if "YOUTUBE_DAILY_BUDGET" not in os.environ and len(pool):
+        pool.ledger.budget = pool.per_key_quota * len(pool)
+
+
+# Process-wide pool used whenever a fetch is not given an explicit key
+KEY_POOL = ApiKeyPool(_keys_from_env())
+_scale_budget(KEY_POOL)
+
+
+def configure_api_keys(keys: Union[str, Iterable[str], Mapping[str, int]]) -> ApiKeyPool:
+    """Replace the keys in ``KEY_POOL``, e.g. with the ones from Streamlit secrets."""
+    parsed = dict(keys) if isinstance(keys, Mapping) else parse_api_keys(keys)
+    KEY_POOL.set_keys(parsed)
+    _scale_budget(KEY_POOL)
+    return KEY_POOL
@@ -0,0 +1,247 @@
+# news_dashboard/quota.py – YouTube Data API quota accounting and refresh pacing
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Callable, Dict, Hashable, Iterable, Optional
+
+import pytz
+
+from .store import STORE_ERRORS, QuotaRow, QuotaUsageStore, get_quota_store
+
+log = logging.getLogger(__name__)
+
+# Quota days roll over at midnight Pacific Time
+QUOTA_TZ = pytz.timezone("America/Los_Angeles")
+
+# Units granted per project per day, and the share of it this app may spend
+DAILY_QUOTA_UNITS = int(os.getenv("YOUTUBE_DAILY_QUOTA", "10000"))
+DAILY_BUDGET_UNITS = int(os.getenv("YOUTUBE_DAILY_BUDGET", str(DAILY_QUOTA_UNITS)))
+
+# Cost of one videos.list call (any part combination, any page)
+VIDEOS_LIST_COST = 1
+
+# How often reads pick up what other processes charged to the shared counters
+QUOTA_SYNC_SEC = float(os.getenv("YOUTUBE_QUOTA_SYNC_SEC", "5"))
+
+
+class QuotaBudgetExceeded(RuntimeError):
+    """Raised instead of calling the API when the daily budget is used up."""
+
+
+def key_label(api_key: Optional[str]) -> str:
+    """Short, non-secret label for an API key (last four characters)."""
+    return f"…{api_key[-4:]}" if api_key else "(none)"
+
+
+@lru_cache(maxsize=64)
+def _key_id(api_key: Optional[str]) -> str:
+    """Stable identifier for an API key that does not reveal it (kept on disk)."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16] if api_key else ""
+
+
+class QuotaLedger:
+    """
+    Thread-safe record of quota units spent in the current quota day.
+
+    Spending is broken down per API key, per region and per Pacific-time hour;
+    all counters reset when the quota day rolls over. Keys are only ever
+    shown through ``key_label`` and counted under a hash of the key.
+
+    With a ``store`` (a getter for the ``quota_usage`` table) every charge
+    goes through the database, so the day's counters survive restarts and
+    are shared by every process on the same file; reads reload them at most
+    every ``QUOTA_SYNC_SEC``. If the table cannot be used, spending is
+    counted in memory only.
+    """
+
+    def __init__(
+        self,
+        budget: int = DAILY_BUDGET_UNITS,
+        clock: Callable[[], float] = time.time,
+        store: Optional[Callable[[], Optional[QuotaUsageStore]]] = None,
+    ) -> None:
+        self.budget = budget
+        self._clock = clock
+        self._store = store
+        self._lock = threading.Lock()
+        self._day: Optional[date] = None
+        self._synced_at = float("-inf")
+        self._labels: Dict[str, str] = {}
+        self.by_key: Counter = Counter()
+        self.by_region: Counter = Counter()
+        self.by_hour: Counter = Counter()
+
+    def _now(self) -> datetime:
+        return datetime.fromtimestamp(self._clock(), QUOTA_TZ)
+
+    def _roll(self, now: datetime) -> None:
+        if now.date() != self._day:
+            self._day = now.date()
+            self._synced_at = float("-inf")
+            self.by_key.clear()
+            self.by_region.clear()
+            self.by_hour.clear()
+
+    def _usage_store(self) -> Optional[QuotaUsageStore]:
+        return self._store() if self._store is not None else None
+
+    def _sync(self, now: datetime) -> None:
+        """Roll the day over and reload the shared counters if they may be out of date."""
+        self._roll(now)
+        store = self._usage_store()
+        if store is None or self._clock() - self._synced_at < QUOTA_SYNC_SEC:
+            return
+        self._synced_at = self._clock()
+        try:
+            rows = store.load(self._day.isoformat())
+        except STORE_ERRORS as exc:
+            log.warning("Could not read quota usage: %s", exc)
+            return
+        self._replace(rows)
+
+    def _replace(self, rows: Iterable[QuotaRow]) -> None:
+        self.by_key.clear()
+        self.by_region.clear()
+        self.by_hour.clear()
+        for row in rows:
+            self._add(row)
+        self._synced_at = self._clock()
+
+    def _add(self, row: QuotaRow) -> None:
+        key_id, label, region_code, hour, units = row
+        self._labels[key_id] = label
+        self.by_key[key_id] += units
+        self.by_region[region_code] += units
+        self.by_hour[hour] += units
+
+    def _spend(self, now: datetime, row: QuotaRow, budget: Optional[int]) -> None:
+        """Add ``row`` unless that would exceed ``budget`` (None: never refuse)."""
+        self._roll(now)
+        store = self._usage_store()
+        if store is not None:
+            try:
+                charged, rows = store.charge(self._day.isoformat(), row, budget)
+            except STORE_ERRORS as exc:
+                log.warning("Could not persist quota usage, counting in memory: %s", exc)
+            else:
+                self._replace(rows)
+                if not charged:
+                    raise self._exceeded()
+                return
+        if budget is not None and sum(self.by_hour.values()) + row[-1] > budget:
+            raise self._exceeded()
+        self._add(row)
+
+    def _exceeded(self) -> QuotaBudgetExceeded:
+        return QuotaBudgetExceeded(
+            f"Daily API budget of {self.budget} units used up "
+            f"({sum(self.by_hour.values())} spent); resets at {self.resets_at():%H:%M %Z}"
+        )
+
+    @staticmethod
+    def _row(now: datetime, units: int, api_key: Optional[str], region_code: str) -> QuotaRow:
+        return (_key_id(api_key), key_label(api_key), region_code or "(none)", now.hour, units)
+
+    def record(self, units: int, api_key: Optional[str] = None, region_code: str = "") -> None:
+        now = self._now()
+        with self._lock:
+            self._spend(now, self._row(now, units, api_key, region_code), None)
+
+    def spent_today(self) -> int:
+        with self._lock:
+            self._sync(self._now())
+            return sum(self.by_hour.values())
+
+    def spent_by_key(self, api_key: str) -> int:
+        with self._lock:
+            self._sync(self._now())
+            return self.by_key.get(_key_id(api_key), 0)
+
+    def remaining(self) -> int:
+        return max(0, self.budget - self.spent_today())
+
+    def can_spend(self, units: int = VIDEOS_LIST_COST) -> bool:
+        return self.remaining() >= units
+
+    def charge(self, units: int, api_key: Optional[str] = None, region_code: str = "") -> None:
+        """Atomically check the budget and record ``units``, or raise QuotaBudgetExceeded."""
+        now = self._now()
+        with self._lock:
+            self._spend(now, self._row(now, units, api_key, region_code), self.budget)
+
+    def resets_at(self) -> datetime:
+        now = self._now()
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        return QUOTA_TZ.localize(midnight)
+
+    def seconds_until_reset(self) -> float:
+        return max(1.0, self.resets_at().timestamp() - self._clock())
+
+    def snapshot(self) -> Dict[str, object]:
+        """Plain-dict view for debug panels."""
+        with self._lock:
+            self._sync(self._now())
+            spent = sum(self.by_hour.values())
+            return {
+                "budget": self.budget,
+                "spent": spent,
+                "remaining": max(0, self.budget - spent),
+                "by_key": {self._labels[k]: v for k, v in self.by_key.items()},
+                "by_region": dict(self.by_region),
+                "by_hour": dict(sorted(self.by_hour.items())),
+            }
+
+
+class RefreshScheduler:
+    """
+    Stretch refresh intervals so the remaining budget lasts until the reset.
+
+    Each refreshed cache key reports what its last refresh cost. If every key
+    seen in the last hour keeps refreshing, one cycle costs the sum of those
+    costs, and the remaining budget allows ``remaining / cycle_cost`` cycles
+    in the time left today. The refresh interval is therefore never shorter
+    than ``seconds_until_reset * cycle_cost / remaining``, nor than the base
+    interval.
+    """
+
+    ACTIVE_WINDOW_SEC = 3600.0
+
+    def __init__(
+        self,
+        ledger: QuotaLedger,
+        base_interval: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ledger = ledger
+        self.base_interval = base_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._costs: Dict[Hashable, tuple] = {}  # key -> (units, refreshed_at)
+
+    def note_refresh(self, key: Hashable, units: int) -> None:
+        with self._lock:
+            self._costs[key] = (units, self._clock())
+
+    def cycle_cost(self) -> int:
+        cutoff = self._clock() - self.ACTIVE_WINDOW_SEC
+        with self._lock:
+            for key in [k for k, (_, at) in self._costs.items() if at < cutoff]:
+                del self._costs[key]
+            return sum(units for units, _ in self._costs.values())
+
+    def refresh_interval(self) -> float:
+        remaining = self.ledger.remaining()
+        until_reset = self.ledger.seconds_until_reset()
+        if remaining <= 0:
+            return until_reset
+        cost = max(1, self.cycle_cost())
+        return max(self.base_interval, until_reset * cost / remaining)
+
+
+# Process-wide ledger, fed by every videos.list call and kept in the quota table
+QUOTA_LEDGER = QuotaLedger(store=get_quota_store)
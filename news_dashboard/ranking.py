@@ -0,0 +1,126 @@
+# news_dashboard/ranking.py – top-K merges over per-region frames sorted by views
+import heapq
+from itertools import islice, repeat
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .youtube import sort_by_views
+
+# (negated view count, run, position in run): heap order is most viewed first
+_Pick = Tuple[int, int, int]
+
+
+class _Run(NamedTuple):
+    """A frame in descending view order, with the columns the merge reads as arrays."""
+
+    df: pd.DataFrame
+    neg_views: np.ndarray
+    is_short: np.ndarray
+
+
+def _prepare(frames: Sequence[pd.DataFrame]) -> List[_Run]:
+    """Drop empty frames and sort any frame not already in descending view order."""
+    runs = []
+    for df in frames:
+        if df.empty:
+            continue
+        if not df["view_count"].is_monotonic_decreasing:
+            df = sort_by_views(df)
+        is_short = (
+            df["is_short"].to_numpy(dtype=bool)
+            if "is_short" in df.columns
+            else np.zeros(len(df), dtype=bool)
+        )
+        runs.append(_Run(df, -df["view_count"].to_numpy(), is_short))
+    return runs
+
+
+def _merge(runs: List[_Run], k: int, is_short: Optional[bool]) -> List[_Pick]:
+    """Heap-merge the runs' rows of one section, stopping after ``k``."""
+    candidates = []
+    for i, run in enumerate(runs):
+        if is_short is None:
+            positions = np.arange(min(k, len(run.df)))
+        else:
+            positions = np.flatnonzero(run.is_short == is_short)[:k]
+        candidates.append(zip(run.neg_views[positions].tolist(), repeat(i), positions.tolist()))
+    return list(islice(heapq.merge(*candidates), k))
+
+
+def _union_rank(runs: List[_Run], picked: List[_Pick]) -> np.ndarray:
+    """
+    Position of each pick in the view-ordered union of all rows of all runs:
+    rows with more views in any run, plus equal views in earlier runs.
+    """
+    neg_views = np.array([neg for neg, _, _ in picked])
+    pick_runs = np.array([i for _, i, _ in picked])
+    rank = np.array([pos for _, _, pos in picked])
+    for i, run in enumerate(runs):
+        ahead = np.searchsorted(run.neg_views, neg_views, side="left")
+        ahead_or_tied = np.searchsorted(run.neg_views, neg_views, side="right")
+        rank += np.where(pick_runs > i, ahead_or_tied, np.where(pick_runs < i, ahead, 0))
+    return rank
+
+
+def _gather(runs: List[_Run], sections: List[List[_Pick]]) -> List[pd.DataFrame]:
+    """
+    Copy the picked rows of every section with a single ``pd.concat``.
+
+    Each run contributes only its head down to its deepest pick; the
+    sections are then taken from that in merge order.
+    """
+    depth = [0] * len(runs)
+    for picked in sections:
+        for _, i, pos in picked:
+            depth[i] = max(depth[i], pos + 1)
+    offsets = np.cumsum([0] + depth[:-1])
+    heads = [run.df.iloc[:d] for run, d in zip(runs, depth) if d]
+    if not heads:
+        return [pd.DataFrame() for _ in sections]
+    union = pd.concat(heads, ignore_index=True)
+
+    # One take for all sections, then split
+    rows = union.take([offsets[i] + pos for picked in sections for _, i, pos in picked])
+    frames, start = [], 0
+    for picked in sections:
+        if not picked:
+            frames.append(pd.DataFrame())
+            continue
+        df = rows.iloc[start:start + len(picked)]
+        df.index = pd.Index(_union_rank(runs, picked))
+        frames.append(df)
+        start += len(picked)
+    return frames
+
+
+def top_by_views(
+    frames: Sequence[pd.DataFrame], k: int, is_short: Optional[bool] = None
+) -> pd.DataFrame:
+    """
+    Return the ``k`` most viewed rows across ``frames``, most viewed first.
+
+    Frames are expected sorted by ``view_count`` descending, as every fetch
+    and snapshot path leaves them; one that is not gets sorted first.
+    ``is_short`` keeps only Shorts (True) or regular videos (False); frames
+    without an ``is_short`` column count as regular videos.
+
+    Instead of concatenating and sorting every row, the frames are merged
+    lazily through a heap that stops after ``k`` rows: O(k log R) heap work
+    for R frames, and each frame is copied only down to its deepest pick.
+    The index holds each row's position in the view-ordered union of all
+    frames, as ``concat`` + ``sort_values`` and then filtering on
+    ``is_short`` gives.
+    """
+    runs = _prepare(frames)
+    return _gather(runs, [_merge(runs, k, is_short)])[0]
+
+
+def top_videos_and_shorts(
+    frames: Sequence[pd.DataFrame], k: int
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """``top_by_views`` for regular videos and for Shorts, copying rows only once."""
+    runs = _prepare(frames)
+    regular, shorts = _gather(runs, [_merge(runs, k, False), _merge(runs, k, True)])
+    return regular, shorts
@@ -0,0 +1,291 @@
+# news_dashboard/resilience.py – retries with backoff and per-host circuit breakers
+import asyncio
+import logging
+import os
+import random
+import re
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from .quota import QuotaBudgetExceeded
+
+log = logging.getLogger(__name__)
+
+# (connect, read) timeouts for API calls; a hung region fails well before 15 s
+REQUEST_TIMEOUT: Tuple[float, float] = (
+    float(os.getenv("YOUTUBE_CONNECT_TIMEOUT_SEC", "3.05")),
+    float(os.getenv("YOUTUBE_READ_TIMEOUT_SEC", "8")),
+)
+
+# Wall-clock budget for one request including its retries: no retry is started
+# that could run past it, so a failing region gives up in about this long
+FETCH_BUDGET_SEC = float(os.getenv("YOUTUBE_FETCH_BUDGET_SEC", "10"))
+
+# Statuses worth retrying: server-side trouble, not our request
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without touching the network while a host's breaker is open."""
+
+
+class RetryPolicy:
+    """
+    Bounded retries with capped exponential backoff and full jitter.
+
+    Besides ``max_attempts``, retries stop once the time spent so far, the
+    backoff and one more ``attempt_timeout`` (the read timeout) would exceed
+    ``budget`` seconds.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = int(os.getenv("YOUTUBE_RETRY_ATTEMPTS", "3")),
+        base_delay: float = 0.25,
+        max_delay: float = 4.0,
+        sleep: Callable[[float], None] = time.sleep,
+        budget: float = FETCH_BUDGET_SEC,
+        attempt_timeout: float = REQUEST_TIMEOUT[1],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.attempt_timeout = attempt_timeout
+        self._sleep = sleep
+        self._clock = clock
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry ``attempt`` (1-based), uniform in [0, base * 2**(attempt-1)]."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def start(self) -> float:
+        """Clock reading to pass to ``retry_delay`` for the request starting now."""
+        return self._clock()
+
+    def retry_delay(self, attempt: int, started: float) -> Optional[float]:
+        """Backoff before retrying after ``attempt``, or None if attempts or budget are spent."""
+        if attempt >= self.max_attempts:
+            return None
+        delay = self.backoff(attempt)
+        if self._clock() - started + delay + self.attempt_timeout > self.budget:
+            return None
+        return delay
+
+    def wait(self, delay: float) -> None:
+        self._sleep(delay)
+
+
+class CircuitBreaker:
+    """
+    Classic closed / open / half-open breaker.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    every call fails fast with ``CircuitOpenError`` for ``reset_timeout``
+    seconds. Then a single trial call is let through: success closes the
+    breaker, failure opens it again.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = int(os.getenv("YOUTUBE_BREAKER_FAILURES", "5")),
+        reset_timeout: float = float(os.getenv("YOUTUBE_BREAKER_RESET_SEC", "30")),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def allow(self) -> None:
+        """Raise ``CircuitOpenError`` unless a call may go out now."""
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            if self._clock() - self._opened_at < self.reset_timeout or self._trial_in_flight:
+                raise CircuitOpenError(f"Circuit for {self.name} is open; failing fast")
+            self._state = self.HALF_OPEN
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    log.warning("Opening circuit for %s after %d failures", self.name, self._failures)
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+
+    def cancel(self) -> None:
+        """Forget a call that ended for reasons unrelated to the host's health."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def stats(self) -> Dict[str, object]:
+        return {"state": self.state, "consecutive_failures": self._failures}
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(url: str) -> CircuitBreaker:
+    """Return the process-wide breaker for ``url``'s host."""
+    host = urlparse(url).netloc or url
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(host)
+        return breaker
+
+
+def breaker_stats() -> Dict[str, Dict[str, object]]:
+    with _breakers_lock:
+        return {host: breaker.stats() for host, breaker in _breakers.items()}
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+def send_with_retry(
+    send: Callable[[], requests.Response],
+    url: str,
+    policy: Optional[RetryPolicy] = None,
+) -> requests.Response:
+    """
+    Call ``send`` through ``url``'s circuit breaker, retrying transient failures.
+
+    Connection errors, timeouts and 5xx responses are retried up to
+    ``policy.max_attempts`` times with jittered exponential backoff, within
+    ``policy.budget`` seconds overall, and count as failures for the
+    breaker. Any other response, 4xx included, is returned as-is. When the
+    retries are used up the last 5xx response is returned, or the last
+    exception is re-raised. A 5xx response that is retried is closed first,
+    so a ``stream=True`` body does not hold its pooled connection.
+    """
+    policy = policy or DEFAULT_RETRY_POLICY
+    breaker = get_breaker(url)
+    started = policy.start()
+    attempt = 1
+    while True:
+        breaker.allow()
+        try:
+            resp = send()
+        except (requests.ConnectionError, requests.Timeout):
+            breaker.record_failure()
+            delay = policy.retry_delay(attempt, started)
+            if delay is None:
+                raise
+        except BaseException:
+            breaker.cancel()
+            raise
+        else:
+            if resp.status_code not in RETRY_STATUSES:
+                breaker.record_success()
+                return resp
+            breaker.record_failure()
+            delay = policy.retry_delay(attempt, started)
+            if delay is None:
+                return resp
+            resp.close()
+        policy.wait(delay)
+        attempt += 1
+
+
+async def send_with_retry_async(
+    send: Callable[[], Awaitable[Any]],
+    url: str,
+    policy: Optional[RetryPolicy] = None,
+) -> Any:
+    """
+    Coroutine twin of ``send_with_retry`` sharing the same breakers and policy.
+
+    ``send`` must return an object with a ``status_code`` and raise
+    ``requests.ConnectionError`` / ``requests.Timeout`` for transport
+    failures; backoff waits with ``asyncio.sleep`` instead of blocking.
+    """
+    policy = policy or DEFAULT_RETRY_POLICY
+    breaker = get_breaker(url)
+    started = policy.start()
+    attempt = 1
+    while True:
+        breaker.allow()
+        try:
+            resp = await send()
+        except (requests.ConnectionError, requests.Timeout):
+            breaker.record_failure()
+            delay = policy.retry_delay(attempt, started)
+            if delay is None:
+                raise
+        except BaseException:
+            breaker.cancel()
+            raise
+        else:
+            if resp.status_code not in RETRY_STATUSES:
+                breaker.record_success()
+                return resp
+            breaker.record_failure()
+            delay = policy.retry_delay(attempt, started)
+            if delay is None:
+                return resp
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+_KEY_PARAM_RE = re.compile(r"(?<=[?&]key=)[^&#\s'\"]+")
+
+
+def redact_keys(text: str) -> str:
+    """Mask the value of any ``key=`` query parameter in ``text`` (URLs, error messages)."""
+    return _KEY_PARAM_RE.sub("REDACTED", text)
+
+
+def describe_error(exc: BaseException) -> str:
+    """
+    Short, key-free description of a fetch error, for the page and for logs.
+
+    HTTP errors are reduced to status and reason, transport errors to their
+    kind; ``requests`` messages quote the full request URL. Anything else is
+    shown as its message with ``key=`` values masked.
+    """
+    response = getattr(exc, "response", None)
+    if isinstance(exc, requests.HTTPError) and response is not None:
+        reason = getattr(response, "reason", None) or ""
+        return f"HTTP {response.status_code} {reason}".rstrip()
+    if isinstance(exc, requests.Timeout):
+        return "the request timed out"
+    if isinstance(exc, requests.ConnectionError):
+        return "could not connect to the API"
+    return redact_keys(str(exc)) or type(exc).__name__
+
+
+# Everything a region fetch may raise that callers should degrade on
+# (serve cached data, report per region) rather than crash the page.
+FETCH_ERRORS = (requests.RequestException, QuotaBudgetExceeded, CircuitOpenError)
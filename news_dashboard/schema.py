@@ -0,0 +1,44 @@
+# news_dashboard/schema.py – compact column dtypes for normalized video frames
+from typing import Dict
+
+import pandas as pd
+
+# Arrow-backed strings: one contiguous buffer per column, not a Python object per cell
+TEXT_DTYPE = pd.StringDtype("pyarrow")
+
+# The dashboard's frame layout. Low-cardinality text is categorical, counts are
+# as narrow as their range allows (view counts pass int32's 2.1 billion on the
+# biggest videos), and like_count is nullable because the API hides likes on
+# some videos.
+VIDEO_DTYPES: Dict[str, object] = {
+    "region_code": "category",
+    "region_label": "category",
+    "video_id": TEXT_DTYPE,
+    "title": TEXT_DTYPE,
+    "description": TEXT_DTYPE,
+    "channel_title": "category",
+    "published_at": TEXT_DTYPE,
+    "view_count": "int64",
+    "like_count": "Int64",
+    "duration_sec": "int32",
+    "is_short": "bool",
+    "thumbnail_url": TEXT_DTYPE,
+    "url": TEXT_DTYPE,
+    "trending_rank": "int32",
+}
+
+
+def apply_video_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cast the columns of a video frame to ``VIDEO_DTYPES``.
+
+    Columns already of the right dtype are left alone, so re-applying the
+    schema is cheap. Needed after ``pd.concat`` (categoricals with different
+    categories fall back to plain strings) and after loading JSON snapshots.
+    """
+    casts = {
+        col: dtype
+        for col, dtype in VIDEO_DTYPES.items()
+        if col in df.columns and df[col].dtype != dtype
+    }
+    return df.astype(casts) if casts else df
@@ -0,0 +1,61 @@
+# news_dashboard/session.py – shared keep-alive HTTP session for API calls
+import os
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Connections kept alive per host; should be >= the fetch engine's max_workers
+DEFAULT_POOL_SIZE = int(os.getenv("YOUTUBE_HTTP_POOL_SIZE", "16"))
+
+# Google APIs only gzip responses when the User-Agent also mentions gzip
+USER_AGENT = "global-news-dashboard/1.0 (gzip)"
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def _build_session(pool_size: int) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        pool_block=False,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {
+            "Accept-Encoding": "gzip",
+            "User-Agent": USER_AGENT,
+            "Connection": "keep-alive",
+        }
+    )
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide pooled session, creating it on first use.
+
+    The session lives at module level, so it is shared by every Streamlit
+    session, rerun and fetch thread in the process and TLS connections to
+    googleapis.com are reused instead of re-established per request.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session(DEFAULT_POOL_SIZE)
+    return _session
+
+
+def configure_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """Replace the shared session with one using ``pool_size`` keep-alive connections."""
+    global _session
+    with _session_lock:
+        old, _session = _session, _build_session(pool_size)
+    if old is not None:
+        old.close()
+    return _session
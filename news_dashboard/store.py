@@ -0,0 +1,295 @@
+# news_dashboard/store.py – on-disk snapshots of normalized region frames
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Protocol, Tuple
+
+import pandas as pd
+
+from .jsonlib import loads
+from .schema import apply_video_schema
+
+log = logging.getLogger(__name__)
+
+# "sqlite" (one database file) or "arrow" (memory-mapped Arrow IPC files, for
+# several UI processes sharing one collector; needs pyarrow)
+SNAPSHOT_BACKEND = os.getenv("YOUTUBE_SNAPSHOT_BACKEND", "sqlite").lower()
+
+# Set the path for the active backend to an empty string to disable disk snapshots
+DEFAULT_SNAPSHOT_DB = os.getenv(
+    "YOUTUBE_SNAPSHOT_DB", os.path.join(".news_cache", "snapshots.sqlite3")
+)
+DEFAULT_ARROW_DIR = os.getenv(
+    "YOUTUBE_SNAPSHOT_ARROW_DIR", os.path.join(".news_cache", "arrow")
+)
+
+# Daily quota counters, shared by every process on this file (a sibling table
+# of the SQLite snapshots, also used with the Arrow backend); empty disables
+DEFAULT_QUOTA_DB = os.getenv("YOUTUBE_QUOTA_DB", DEFAULT_SNAPSHOT_DB)
+
+# How long a reader or writer waits on a lock held by another process
+BUSY_TIMEOUT_SEC = float(os.getenv("YOUTUBE_SNAPSHOT_DB_TIMEOUT_SEC", "5"))
+
+SnapshotKey = Tuple[str, str, int]  # (region_code, category_id, max_results)
+
+# What a backend may raise for a missing, locked, corrupt or unwritable store
+STORE_ERRORS = (sqlite3.Error, OSError, ValueError)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    region_code TEXT NOT NULL,
+    category_id TEXT NOT NULL,
+    max_results INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    records TEXT NOT NULL,
+    PRIMARY KEY (region_code, category_id, max_results)
+)
+"""
+
+_QUOTA_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quota_usage (
+    day TEXT NOT NULL,
+    key_id TEXT NOT NULL,
+    key_label TEXT NOT NULL,
+    region_code TEXT NOT NULL,
+    hour INTEGER NOT NULL,
+    units INTEGER NOT NULL,
+    PRIMARY KEY (day, key_id, region_code, hour)
+)
+"""
+
+# (key_id, key_label, region_code, hour, units), one per counter of a quota day
+QuotaRow = Tuple[str, str, str, int, int]
+
+
+@dataclass
+class Snapshot:
+    """A normalized region frame plus the wall-clock time it was fetched."""
+
+    df: pd.DataFrame
+    fetched_at: float
+
+    @property
+    def age_sec(self) -> float:
+        return max(0.0, time.time() - self.fetched_at)
+
+
+class SnapshotBackend(Protocol):
+    path: str
+
+    def fetched_at(self, key: SnapshotKey) -> Optional[float]: ...
+
+    def load(self, key: SnapshotKey) -> Optional[Snapshot]: ...
+
+    def save(self, key: SnapshotKey, df: pd.DataFrame, fetched_at: Optional[float] = None) -> None: ...
+
+    def delete(self, key: SnapshotKey) -> None: ...
+
+    def close(self) -> None: ...
+
+
+def _frame_to_json(df: pd.DataFrame) -> str:
+    # to_json writes missing values (NA, NaN) as null; JSON has no dtypes, so
+    # the video schema is applied again on load.
+    return df.to_json(orient="records")
+
+
+def _frame_from_json(records: str) -> pd.DataFrame:
+    rows = loads(records)
+    return apply_video_schema(pd.DataFrame(rows)) if rows else pd.DataFrame()
+
+
+class SnapshotStore:
+    """
+    SQLite-backed store holding the last fetched frame per cache key.
+
+    Snapshots survive process restarts, so a fresh server can serve the last
+    known data immediately instead of refetching every region cold. The
+    database runs in WAL mode so it can also be shared between processes:
+    a standalone collector (``python -m news_dashboard collect``) writes,
+    Streamlit replicas read.
+    """
+
+    def __init__(self, path: str = DEFAULT_SNAPSHOT_DB) -> None:
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=BUSY_TIMEOUT_SEC, check_same_thread=False)
+        with self._lock, self._conn:
+            # WAL lets one collector write while any number of UI processes read
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_SCHEMA)
+
+    def load(self, key: SnapshotKey) -> Optional[Snapshot]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, records FROM snapshots "
+                "WHERE region_code = ? AND category_id = ? AND max_results = ?",
+                key,
+            ).fetchone()
+        if row is None:
+            return None
+        fetched_at, records = row
+        return Snapshot(_frame_from_json(records), fetched_at)
+
+    def fetched_at(self, key: SnapshotKey) -> Optional[float]:
+        """Publication time of the stored snapshot, without decoding its records."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at FROM snapshots "
+                "WHERE region_code = ? AND category_id = ? AND max_results = ?",
+                key,
+            ).fetchone()
+        return row[0] if row else None
+
+    def save(self, key: SnapshotKey, df: pd.DataFrame, fetched_at: Optional[float] = None) -> None:
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        records = _frame_to_json(df)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO snapshots "
+                "(region_code, category_id, max_results, fetched_at, records) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (*key, fetched_at, records),
+            )
+
+    def delete(self, key: SnapshotKey) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM snapshots "
+                "WHERE region_code = ? AND category_id = ? AND max_results = ?",
+                key,
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class QuotaUsageStore:
+    """
+    SQLite table of quota units spent per quota day, API key, region and hour.
+
+    Restarts reload the day's spending instead of starting from zero, and
+    every process using the file (Streamlit replicas, the collector) charges
+    the same counters. Keys are stored as a hash plus their ``key_label``.
+    """
+
+    def __init__(self, path: str = DEFAULT_QUOTA_DB) -> None:
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        # Autocommit mode: charge() opens its own write transaction
+        self._conn = sqlite3.connect(
+            path, timeout=BUSY_TIMEOUT_SEC, check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_QUOTA_SCHEMA)
+
+    def _rows(self, day: str) -> List[QuotaRow]:
+        return self._conn.execute(
+            "SELECT key_id, key_label, region_code, hour, units FROM quota_usage WHERE day = ?",
+            (day,),
+        ).fetchall()
+
+    def load(self, day: str) -> List[QuotaRow]:
+        """All counters of quota day ``day``."""
+        with self._lock:
+            return self._rows(day)
+
+    def charge(
+        self, day: str, row: QuotaRow, budget: Optional[int] = None
+    ) -> Tuple[bool, List[QuotaRow]]:
+        """
+        Add ``row``'s units unless the day's total would exceed ``budget``.
+
+        Check and update run in one write transaction, so concurrent processes
+        cannot overspend together. Returns whether the units were added, and
+        the day's counters afterwards.
+        """
+        key_id, label, region_code, hour, units = row
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                (spent,) = self._conn.execute(
+                    "SELECT COALESCE(SUM(units), 0) FROM quota_usage WHERE day = ?", (day,)
+                ).fetchone()
+                charged = budget is None or spent + units <= budget
+                if charged:
+                    self._conn.execute(
+                        "INSERT INTO quota_usage "
+                        "(day, key_id, key_label, region_code, hour, units) "
+                        "VALUES (?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT (day, key_id, region_code, hour) "
+                        "DO UPDATE SET units = units + excluded.units",
+                        (day, key_id, label, region_code, hour, units),
+                    )
+                    # Earlier days are never read again
+                    self._conn.execute("DELETE FROM quota_usage WHERE day < ?", (day,))
+                rows = self._rows(day)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return charged, rows
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _open_store() -> SnapshotBackend:
+    if SNAPSHOT_BACKEND == "arrow":
+        from .arrow_store import ArrowSnapshotStore  # pyarrow only needed here
+
+        return ArrowSnapshotStore(DEFAULT_ARROW_DIR)
+    if SNAPSHOT_BACKEND != "sqlite":
+        raise ValueError(f"Unknown YOUTUBE_SNAPSHOT_BACKEND {SNAPSHOT_BACKEND!r}")
+    return SnapshotStore(DEFAULT_SNAPSHOT_DB)
+
+
+_store: Optional[SnapshotBackend] = None
+_store_disabled = not (DEFAULT_ARROW_DIR if SNAPSHOT_BACKEND == "arrow" else DEFAULT_SNAPSHOT_DB)
+_store_lock = threading.Lock()
+
+
+def get_snapshot_store() -> Optional[SnapshotBackend]:
+    """Return the process-wide snapshot store, or None when disabled or unavailable."""
+    global _store, _store_disabled
+    if _store is None and not _store_disabled:
+        with _store_lock:
+            if _store is None and not _store_disabled:
+                try:
+                    _store = _open_store()
+                except (ImportError, *STORE_ERRORS) as exc:
+                    log.warning("Snapshot store disabled: %s", exc)
+                    _store_disabled = True
+    return _store
+
+
+_quota_store: Optional[QuotaUsageStore] = None
+_quota_store_disabled = not DEFAULT_QUOTA_DB
+
+
+def get_quota_store() -> Optional[QuotaUsageStore]:
+    """Return the process-wide quota table, or None when disabled or unavailable."""
+    global _quota_store, _quota_store_disabled
+    if _quota_store is None and not _quota_store_disabled:
+        with _store_lock:
+            if _quota_store is None and not _quota_store_disabled:
+                try:
+                    _quota_store = QuotaUsageStore(DEFAULT_QUOTA_DB)
+                except STORE_ERRORS as exc:
+                    log.warning("Quota persistence disabled: %s", exc)
+                    _quota_store_disabled = True
+    return _quota_store
@@ -0,0 +1,82 @@
+# news_dashboard/ttl.py – thread-safe TTL/LRU mapping
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+DEFAULT_TTL_SEC = float(os.getenv("YOUTUBE_CACHE_TTL_SEC", "300"))
+DEFAULT_MAX_ENTRIES = int(os.getenv("YOUTUBE_CACHE_MAX_ENTRIES", "256"))
+
+
+class TTLCache:
+    """
+    Thread-safe mapping with a per-entry time-to-live and LRU eviction.
+
+    Expired entries count as misses and are dropped on access. When the cache
+    is full the least recently used entry is evicted.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL_SEC,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, value = entry
+            if self._clock() - stored_at > self.ttl:
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, age: float = 0.0) -> None:
+        """Store ``value``; ``age`` backdates entries that were fetched earlier."""
+        with self._lock:
+            self._data[key] = (self._clock() - age, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop ``key``; return True if it was present."""
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_sec": self.ttl,
+            }
@@ -0,0 +1,161 @@
+# news_dashboard/worker.py – background pre-warming of every region
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from .cache import (
+    REFRESH_SCHEDULER,
+    fetch_depth,
+    publish_region,
+    refresh_region,
+    report_region_failure,
+)
+from .engine import DEFAULT_MAX_WORKERS, RegionResult, fetch_regions, fetch_regions_async
+from .resilience import describe_error
+from .youtube import DEFAULT_ASYNC_CONCURRENCY, MAX_RESULTS_PER_PAGE, REGION_LABELS_BY_CODE
+
+log = logging.getLogger(__name__)
+
+# Set YOUTUBE_PREWARM=0 to fetch inline from the UI instead
+PREWARM_ENABLED = os.getenv("YOUTUBE_PREWARM", "1") != "0"
+
+# Set YOUTUBE_EXTERNAL_COLLECTOR=1 when a separate ``python -m news_dashboard collect``
+# process feeds the snapshot store; UI processes then only read from it
+EXTERNAL_COLLECTOR = os.getenv("YOUTUBE_EXTERNAL_COLLECTOR", "0") == "1"
+
+# Set YOUTUBE_ASYNC_FETCH=1 to run each cycle on one asyncio loop (needs aiohttp)
+ASYNC_FETCH = os.getenv("YOUTUBE_ASYNC_FETCH", "0") == "1"
+
+# Fixed cadence in seconds; unset means "follow REFRESH_SCHEDULER" (TTL, stretched by quota)
+PREWARM_INTERVAL_SEC = float(os.getenv("YOUTUBE_PREWARM_INTERVAL_SEC", "0")) or None
+
+
+def _refresh_frame(region_code: str, **kwargs):
+    return refresh_region(region_code, **kwargs).df
+
+
+class IngestionWorker:
+    """
+    Daemon thread that refreshes a set of regions on a schedule.
+
+    Each cycle fetches every region concurrently through the shared cache
+    (``refresh_region``), so results land in memory and on disk for all UI
+    sessions. With ``use_async`` the cycle instead runs every region and page
+    on one event loop (``fetch_regions_async``, at most ``concurrency``
+    requests in flight) and publishes the frames afterwards. Between cycles
+    it sleeps for ``interval`` seconds or, by default, the quota-aware
+    ``REFRESH_SCHEDULER`` interval.
+    """
+
+    def __init__(
+        self,
+        region_codes: Optional[Iterable[str]] = None,
+        max_results: int = MAX_RESULTS_PER_PAGE,
+        interval: Optional[float] = PREWARM_INTERVAL_SEC,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        use_async: bool = ASYNC_FETCH,
+        concurrency: int = DEFAULT_ASYNC_CONCURRENCY,
+    ) -> None:
+        self.region_codes = list(region_codes or REGION_LABELS_BY_CODE)
+        self.max_results = max_results
+        self.interval = interval
+        self.max_workers = max_workers
+        self.use_async = use_async
+        self.concurrency = concurrency
+        self.last_run_at: Optional[float] = None
+        self.last_results: Dict[str, RegionResult] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def next_interval(self) -> float:
+        return self.interval if self.interval else REFRESH_SCHEDULER.refresh_interval()
+
+    def run_once(self) -> Dict[str, RegionResult]:
+        """Refresh every region once and return the per-region results."""
+        if self.use_async:
+            results = self._run_async()
+        else:
+            results = fetch_regions(
+                self.region_codes,
+                max_results=self.max_results,
+                max_workers=self.max_workers,
+                fetch=_refresh_frame,
+            )
+        for code, result in results.items():
+            if not result.ok:
+                log.warning("Pre-warm of %s failed: %s", code, describe_error(result.error))
+        log.info(
+            "Refreshed %d/%d regions",
+            sum(r.ok for r in results.values()),
+            len(results),
+        )
+        self.last_run_at = time.time()
+        self.last_results = results
+        return results
+
+    def _run_async(self) -> Dict[str, RegionResult]:
+        depth = fetch_depth(self.max_results)
+        results = asyncio.run(
+            fetch_regions_async(self.region_codes, depth, concurrency=self.concurrency)
+        )
+        for code, result in results.items():
+            if result.ok:
+                publish_region(code, result.df, depth)
+            else:
+                report_region_failure(code, result.error, depth)
+        return results
+
+    def run_forever(self) -> None:
+        """Run cycles on the calling thread until ``stop()`` is called."""
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                log.exception("Pre-warm cycle failed")
+            self._stop.wait(self.next_interval())
+
+    def start(self) -> "IngestionWorker":
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self.run_forever, name="region-prewarm", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    @property
+    def is_alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def status(self) -> Dict[str, object]:
+        return {
+            "alive": self.is_alive,
+            "regions": len(self.region_codes),
+            "mode": "asyncio" if self.use_async else "threads",
+            "last_run_age_sec": (
+                round(time.time() - self.last_run_at) if self.last_run_at else None
+            ),
+            "failed": [code for code, r in self.last_results.items() if not r.ok],
+            "next_interval_sec": round(self.next_interval()),
+        }
+
+
+_worker: Optional[IngestionWorker] = None
+_worker_lock = threading.Lock()
+
+
+def start_background_worker(**kwargs) -> IngestionWorker:
+    """Start (once per process) and return the shared pre-warming worker."""
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = IngestionWorker(**kwargs)
+        return _worker.start()
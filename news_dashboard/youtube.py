@@ -0,0 +1,817 @@
+# news_dashboard/youtube.py – YouTube Data API access and normalization
+import asyncio
+import os
+import re
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Iterator, List, Mapping, NamedTuple, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import requests
+
+try:
+    import aiohttp
+except ImportError:  # optional: only the async fetch path needs it
+    aiohttp = None
+
+from .fields import VIDEO_FIELDS, VIDEO_PARTS
+from .jsonlib import decode_json, iter_response_array
+from .keys import KEY_POOL
+from .quota import QUOTA_LEDGER, VIDEOS_LIST_COST
+from .resilience import REQUEST_TIMEOUT, redact_keys, send_with_retry, send_with_retry_async
+from .schema import TEXT_DTYPE, apply_video_schema
+from .session import USER_AGENT, get_session
+from .ttl import DEFAULT_MAX_ENTRIES, TTLCache
+
+YOUTUBE_API_URL = "https://www.googleapis.com/youtube/v3"
+
+# API keys travel in this header rather than as ?key=, so request URLs (and the
+# exception messages and logs that quote them) never contain a key
+API_KEY_HEADER = "X-Goog-Api-Key"
+
+# videoCategoryId for News & Politics
+NEWS_CATEGORY_ID = "25"
+
+# Largest maxResults the videos.list endpoint accepts per page
+MAX_RESULTS_PER_PAGE = 50
+
+# Cap on videos collected across pages by the paginated fetch
+MAX_TOTAL_RESULTS = int(os.getenv("YOUTUBE_MAX_TOTAL_RESULTS", "200"))
+
+# Bytes read per chunk when streaming a response body (iter_trending_news_records)
+STREAM_CHUNK_SIZE = int(os.getenv("YOUTUBE_STREAM_CHUNK_SIZE", "16384"))
+
+# Requests one AsyncYouTubeClient keeps in flight at most (all regions and pages)
+DEFAULT_ASYNC_CONCURRENCY = int(os.getenv("YOUTUBE_ASYNC_CONCURRENCY", "32"))
+
+# Canonical label per region code (used in combined view)
+REGION_LABELS_BY_CODE = {
+    "US": "United States",
+    "CA": "Canada",
+    "GB": "United Kingdom",
+    "IN": "India",
+    "AU": "Australia",
+    "DE": "Germany",
+    "FR": "France",
+    "BR": "Brazil",
+    "JP": "Japan",
+    "MX": "Mexico",
+}
+
+# ----------------- UTILS ---------------------------------
+
+# Days, years and months have no fixed length in ISO 8601; the API only ever
+# emits days (P#DT#H#M#S), years and months are read as 365 and 30 days.
+_DURATION_NUM = r"(\d+(?:[.,]\d+)?)"
+ISO_DURATION_RE = re.compile(
+    r"P(?=\d|T\d)"             # starts with P, at least one component
+    rf"(?:{_DURATION_NUM}Y)?"  # years
+    rf"(?:{_DURATION_NUM}M)?"  # months
+    rf"(?:{_DURATION_NUM}W)?"  # weeks
+    rf"(?:{_DURATION_NUM}D)?"  # days
+    r"(?:T(?=\d)"              # time part, at least one component
+    rf"(?:{_DURATION_NUM}H)?"  # hours
+    rf"(?:{_DURATION_NUM}M)?"  # minutes
+    rf"(?:{_DURATION_NUM}S)?"  # seconds (may be fractional, like any component)
+    r")?"
+)
+_DURATION_UNIT_SEC = (365 * 86400, 30 * 86400, 7 * 86400, 86400, 3600, 60, 1)
+
+# Distinct duration strings remembered by parse_iso_duration
+DURATION_CACHE_SIZE = int(os.getenv("YOUTUBE_DURATION_CACHE_SIZE", "4096"))
+
+
+@lru_cache(maxsize=DURATION_CACHE_SIZE)
+def parse_iso_duration(s: str) -> int:
+    """
+    Return duration in seconds from ISO-8601 string like 'PT3M12S' or 'P1DT2H'.
+
+    Accepts the full ``PnYnMnWnDTnHnMnS`` form, including fractional values
+    ('PT1.5S', 'PT0,5S'), rounded to the nearest second. Empty or malformed
+    strings, and 'P0D' (live streams), give 0. Results are memoized in a
+    bounded LRU cache, since trending lists repeat the same strings.
+    """
+    if not s or not isinstance(s, str):
+        return 0
+    m = ISO_DURATION_RE.fullmatch(s)
+    if not m:
+        return 0
+    total = 0.0
+    for value, unit_sec in zip(m.groups(), _DURATION_UNIT_SEC):
+        if value:
+            total += float(value.replace(",", ".")) * unit_sec
+    return int(total + 0.5)
+
+
+def parse_iso_durations(values: Sequence[Optional[str]]) -> np.ndarray:
+    """
+    Batch ``parse_iso_duration``: int64 seconds for each value.
+
+    Trending pages repeat a small set of duration strings, so the batch is
+    factorized and each distinct string is parsed once, then broadcast back.
+    """
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+    parsed = np.fromiter(
+        (parse_iso_duration(u) for u in uniques), dtype=np.int64, count=len(uniques)
+    )
+    # Missing values get code -1, which picks the trailing 0
+    return np.append(parsed, 0)[codes]
+
+
+# Videos up to this long count as Shorts even without a #shorts tag. A zero
+# duration (live streams and premieres report P0D, unknown or malformed
+# values parse to 0) says nothing about length and never counts.
+SHORTS_MAX_DURATION_SEC = 75
+
+
+def _tagged_short(title: str, description: str) -> bool:
+    # lower() never produces "#", so untagged text is never lowercased
+    if "#" not in title and "#" not in description:
+        return False
+    text = (title + " " + description).lower()
+    return "#shorts" in text or " #short " in text
+
+
+def mark_shorts(
+    titles: Sequence[str], descriptions: Sequence[str], durations: np.ndarray
+) -> np.ndarray:
+    """
+    Batch Shorts classification: ``#shorts`` / `` #short `` in the lowercased
+    title + description, or a known duration of at most ``SHORTS_MAX_DURATION_SEC``.
+    """
+    tagged = np.fromiter(
+        map(_tagged_short, titles, descriptions), dtype=bool, count=len(titles)
+    )
+    return tagged | ((durations > 0) & (durations <= SHORTS_MAX_DURATION_SEC))
+
+
+# ----------------- NORMALIZATION -----------------------
+
+class VideoRecord(NamedTuple):
+    """
+    One decoded ``videos.list`` item: the per-video fields of the dashboard's frame.
+
+    Region, chart rank and watch URL are not stored; they follow from the
+    request and the item's position, and are added when records become a frame.
+    ``duration`` is the raw ISO 8601 string: ``duration_sec`` and ``is_short``
+    are computed per batch by ``records_to_frame``.
+    """
+
+    video_id: Optional[str]
+    title: str
+    description: str
+    channel_title: str
+    published_at: str
+    view_count: int
+    like_count: Optional[int]
+    duration: str
+    thumbnail_url: Optional[str]
+
+
+# Shared stand-in for absent sub-objects; never mutated, so one instance serves every item
+_ABSENT: Mapping = MappingProxyType({})
+
+# VideoRecord(*fields) goes through a generated Python __new__; this is the C constructor
+_new_record = tuple.__new__
+
+
+def decode_video(item: Mapping) -> VideoRecord:
+    """
+    Decode one ``videos.list`` item straight into a ``VideoRecord``.
+
+    Missing parts fall back to a shared empty mapping instead of a fresh dict
+    per lookup. The duration is kept as sent; parsing it and classifying
+    Shorts is left to the batch step in ``records_to_frame``.
+    """
+    snippet = item.get("snippet") or _ABSENT
+    stats = item.get("statistics") or _ABSENT
+    thumbs = snippet.get("thumbnails") or _ABSENT
+
+    # Pick a decent thumbnail
+    thumb = (
+        thumbs.get("medium")
+        or thumbs.get("high")
+        or thumbs.get("standard")
+        or thumbs.get("default")
+        or _ABSENT
+    )
+
+    like_count = stats.get("likeCount")
+    return _new_record(
+        VideoRecord,
+        (
+            item.get("id"),
+            snippet.get("title", ""),
+            snippet.get("description") or "",
+            snippet.get("channelTitle") or "",
+            snippet.get("publishedAt", ""),
+            int(stats.get("viewCount", 0)),
+            None if like_count is None else int(like_count),
+            (item.get("contentDetails") or _ABSENT).get("duration", ""),
+            thumb.get("url"),
+        ),
+    )
+
+
+def decode_videos(items: Sequence[Mapping]) -> List[VideoRecord]:
+    """Decode ``videos.list`` items into records, in chart order."""
+    return list(map(decode_video, items))
+
+
+def _columns_to_frame(
+    columns: Sequence[Sequence], region_code: str, start_rank: int
+) -> pd.DataFrame:
+    """
+    Assemble the flat frame from one sequence per ``VideoRecord`` field.
+
+    Region, rank and URL columns are generated alongside, and durations and
+    Shorts flags are computed for the whole batch with ``parse_iso_durations``
+    and ``mark_shorts``. Columns are built directly in the compact
+    ``VIDEO_DTYPES`` schema.
+    """
+    (
+        video_ids,
+        titles,
+        descriptions,
+        channel_titles,
+        published_at,
+        view_counts,
+        like_counts,
+        durations,
+        thumbnail_urls,
+    ) = columns
+    n = len(video_ids)
+    duration_sec = parse_iso_durations(durations)
+    region_label = REGION_LABELS_BY_CODE.get(region_code, region_code)
+
+    # Every column is built in its VIDEO_DTYPES dtype, so no cast pass follows
+    region = np.zeros(n, dtype=np.int8)
+    return pd.DataFrame(
+        {
+            "region_code": pd.Categorical.from_codes(region, categories=[region_code]),
+            "region_label": pd.Categorical.from_codes(region, categories=[region_label]),
+            "video_id": pd.array(video_ids, dtype=TEXT_DTYPE),
+            "title": pd.array(titles, dtype=TEXT_DTYPE),
+            "description": pd.array(descriptions, dtype=TEXT_DTYPE),
+            "channel_title": pd.Categorical(channel_titles),
+            "published_at": pd.array(published_at, dtype=TEXT_DTYPE),
+            "view_count": np.array(view_counts, dtype=np.int64),
+            "like_count": pd.array(like_counts, dtype="Int64"),
+            "duration_sec": duration_sec.astype(np.int32),
+            "is_short": mark_shorts(titles, descriptions, duration_sec),
+            "thumbnail_url": pd.array(thumbnail_urls, dtype=TEXT_DTYPE),
+            "url": pd.array(
+                [f"https://www.youtube.com/watch?v={vid}" for vid in video_ids], dtype=TEXT_DTYPE
+            ),
+            "trending_rank": np.arange(start_rank, start_rank + n, dtype=np.int32),
+        },
+        copy=False,
+    )
+
+
+def records_to_frame(
+    records: Sequence[VideoRecord], region_code: str, start_rank: int = 1
+) -> pd.DataFrame:
+    """
+    Bulk path from records to the dashboard's flat frame, in record order.
+
+    Records are tuples, so ``zip(*records)`` transposes them into one tuple
+    per field in a single C-level pass. Used for records collected from
+    ``iter_trending_news_records``; whole pages go through ``normalize_videos``.
+    """
+    if not records:
+        return pd.DataFrame()
+    return _columns_to_frame(tuple(zip(*records)), region_code, start_rank)
+
+
+def normalize_videos(
+    items: List[dict], region_code: str, start_rank: int = 1
+) -> pd.DataFrame:
+    """
+    Turn ``videos.list`` items into the dashboard's flat frame, in chart order.
+
+    ``start_rank`` is the chart position of the first item, so frames built
+    from later pages continue the ``trending_rank`` numbering.
+
+    Built column by column: one pass over the items appends each field to its
+    own list, with no per-video record and no transposition afterwards (see
+    ``benchmarks/bench_decode.py``). Fields are read as in ``decode_video``.
+    """
+    if not items:
+        return pd.DataFrame()
+
+    video_ids: List[Optional[str]] = []
+    titles: List[str] = []
+    descriptions: List[str] = []
+    channel_titles: List[str] = []
+    published_at: List[str] = []
+    view_counts: List[int] = []
+    like_counts: List[Optional[int]] = []
+    durations: List[str] = []
+    thumbnail_urls: List[Optional[str]] = []
+
+    for item in items:
+        snippet = item.get("snippet") or _ABSENT
+        stats = item.get("statistics") or _ABSENT
+        thumbs = snippet.get("thumbnails") or _ABSENT
+
+        # Pick a decent thumbnail
+        thumb = (
+            thumbs.get("medium")
+            or thumbs.get("high")
+            or thumbs.get("standard")
+            or thumbs.get("default")
+            or _ABSENT
+        )
+
+        like_count = stats.get("likeCount")
+        video_ids.append(item.get("id"))
+        titles.append(snippet.get("title", ""))
+        descriptions.append(snippet.get("description") or "")
+        channel_titles.append(snippet.get("channelTitle") or "")
+        published_at.append(snippet.get("publishedAt", ""))
+        view_counts.append(int(stats.get("viewCount", 0)))
+        like_counts.append(None if like_count is None else int(like_count))
+        durations.append((item.get("contentDetails") or _ABSENT).get("duration", ""))
+        thumbnail_urls.append(thumb.get("url"))
+
+    columns = (
+        video_ids,
+        titles,
+        descriptions,
+        channel_titles,
+        published_at,
+        view_counts,
+        like_counts,
+        durations,
+        thumbnail_urls,
+    )
+    return _columns_to_frame(columns, region_code, start_rank)
+
+
+def sort_by_views(df: pd.DataFrame) -> pd.DataFrame:
+    """Sort a normalized frame by view count (descending) with a fresh index."""
+    if df.empty:
+        return df
+    df = df.sort_values("view_count", ascending=False)
+    df.reset_index(drop=True, inplace=True)
+    return df
+
+
+# ----------------- YOUTUBE API CALL ----------------------
+
+def _videos_params(
+    region_code: str,
+    max_results: int,
+    api_key: Optional[str],
+    category_id: str,
+    page_token: Optional[str] = None,
+) -> dict:
+    params = {
+        "part": VIDEO_PARTS,
+        "fields": VIDEO_FIELDS,
+        "chart": "mostPopular",
+        "regionCode": region_code,
+        "videoCategoryId": category_id,
+        "maxResults": max_results,
+    }
+    if api_key:
+        params["key"] = api_key
+    if page_token:
+        params["pageToken"] = page_token
+    return params
+
+
+class Page(NamedTuple):
+    """One normalized ``videos.list`` page (chart order) and its paging/validator data."""
+
+    df: pd.DataFrame
+    next_page_token: Optional[str]
+    etag: Optional[str]
+
+
+# Last page seen per request (minus the API key), used to send If-None-Match.
+# Entries never expire: a stale validator just costs one full 200 response.
+PAGE_VALIDATORS = TTLCache(maxsize=DEFAULT_MAX_ENTRIES * 4, ttl=float("inf"))
+
+
+def _validator_key(params: dict) -> tuple:
+    return tuple(sorted((k, str(v)) for k, v in params.items() if k != "key"))
+
+
+def _error_reason(resp) -> str:
+    """Return the first ``error.errors[].reason`` of an API error response, if any."""
+    try:
+        return decode_json(resp.content)["error"]["errors"][0]["reason"]
+    except (ValueError, KeyError, IndexError, TypeError):
+        return ""
+
+
+def _build_page(
+    vkey: tuple, data: dict, etag: Optional[str], region_code: str, start_rank: int
+) -> Page:
+    """Normalize a decoded page and remember it as the validator for ``vkey``."""
+    page = Page(
+        df=normalize_videos(data.get("items", []), region_code, start_rank=start_rank),
+        next_page_token=data.get("nextPageToken"),
+        etag=etag,
+    )
+    if etag:
+        PAGE_VALIDATORS.set(vkey, page)
+    return page
+
+
+class _KeyRotation:
+    """
+    Key choice for one ``videos.list`` request, shared by the sync and async paths.
+
+    An explicit ``key`` in the params is used once. Otherwise each attempt
+    takes a key from ``KEY_POOL``; a key rejected for quota or rate limits
+    (403 / 429) is reported to the pool, which cools it down, and the
+    request moves on to the next key, at most once per key in the pool.
+    """
+
+    def __init__(self, params: dict) -> None:
+        self.explicit_key: Optional[str] = params.get("key")
+        self._keys_left = 1 if self.explicit_key else max(1, len(KEY_POOL))
+
+    def next_key(self) -> str:
+        self._keys_left -= 1
+        return self.explicit_key or KEY_POOL.acquire()
+
+    def should_rotate(self, api_key: str, resp) -> bool:
+        """True if ``resp`` rejected ``api_key`` and another key should be tried."""
+        if self.explicit_key or resp.status_code not in (403, 429):
+            return False
+        return KEY_POOL.report_error(api_key, _error_reason(resp)) and self._keys_left > 0
+
+
+def _keyed_request(params: dict, headers: Optional[dict], api_key: str) -> tuple:
+    """``(query, headers)`` for one attempt: ``key`` moves from the params to ``API_KEY_HEADER``."""
+    query = {k: v for k, v in params.items() if k != "key"}
+    return query, {**(headers or {}), API_KEY_HEADER: api_key}
+
+
+def _send_videos_request(
+    params: dict, region_code: str, headers: Optional[dict] = None, stream: bool = False
+) -> requests.Response:
+    """
+    GET ``videos.list`` with quota accounting, key rotation and retries.
+
+    Every call is charged to ``QUOTA_LEDGER`` first and refused with
+    ``QuotaBudgetExceeded`` once the daily budget is spent. Without an
+    explicit ``key`` in ``params`` the key comes from ``KEY_POOL``; a key
+    rejected for quota or rate limits is cooled down and the request is
+    retried once with each remaining key. Timeouts, connection errors and 5xx
+    responses are retried with backoff behind the googleapis circuit breaker.
+    With ``stream=True`` the body is left unread for ``iter_content``.
+    """
+    url = f"{YOUTUBE_API_URL}/videos"
+    rotation = _KeyRotation(params)
+    while True:
+        api_key = rotation.next_key()
+
+        query, key_headers = _keyed_request(params, headers, api_key)
+
+        def send() -> requests.Response:
+            QUOTA_LEDGER.charge(VIDEOS_LIST_COST, api_key, region_code)
+            return get_session().get(
+                url,
+                params=query,
+                headers=key_headers,
+                timeout=REQUEST_TIMEOUT,
+                stream=stream,
+            )
+
+        resp = send_with_retry(send, url)
+        if not rotation.should_rotate(api_key, resp):
+            return resp
+
+
+def _fetch_page(params: dict, region_code: str, start_rank: int = 1) -> Page:
+    """
+    GET one ``videos.list`` page and normalize it.
+
+    When an earlier response for the same request carried an ETag, it is sent
+    back as ``If-None-Match``; on ``304 Not Modified`` the previously
+    normalized page is returned as-is, skipping JSON parsing and normalization.
+    Quota, key rotation and retries are handled by ``_send_videos_request``.
+    """
+    vkey = _validator_key(params)
+    previous: Optional[Page] = PAGE_VALIDATORS.get(vkey)
+    headers = {"If-None-Match": previous.etag} if previous is not None else None
+
+    resp = _send_videos_request(params, region_code, headers)
+    if resp.status_code == 304 and previous is not None:
+        return previous
+    resp.raise_for_status()
+    data = decode_json(resp.content)
+    return _build_page(vkey, data, resp.headers.get("ETag"), region_code, start_rank)
+
+
+def fetch_trending_news_for_region(
+    region_code: str,
+    max_results: int = MAX_RESULTS_PER_PAGE,
+    api_key: Optional[str] = None,
+    category_id: str = NEWS_CATEGORY_ID,
+) -> pd.DataFrame:
+    """
+    Fetch trending *News & Politics* videos for a region and return a DataFrame.
+
+    Uses:
+    - chart=mostPopular
+    - videoCategoryId=25 (News & Politics)
+
+    ``api_key`` defaults to the next key from ``KEY_POOL``.
+    Rows are sorted by view count; ``trending_rank`` keeps the chart position.
+    """
+    page = _fetch_page(
+        _videos_params(region_code, max_results, api_key, category_id), region_code
+    )
+    return sort_by_views(page.df)
+
+
+def iter_trending_news_pages(
+    region_code: str,
+    max_total: int = MAX_TOTAL_RESULTS,
+    api_key: Optional[str] = None,
+    category_id: str = NEWS_CATEGORY_ID,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield one normalized frame (in chart order) per API page, following
+    ``nextPageToken`` until ``max_total`` videos have been seen.
+
+    Page tokens only arrive with the previous page, so requests cannot run in
+    parallel; instead the next page is requested on a helper thread as soon
+    as its token is known, while the caller is still consuming the current
+    page. Rendering can start on the first page before the last one lands.
+    """
+    fetched = 0
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-fetch") as pool:
+        pending: Optional[Future] = pool.submit(
+            _fetch_page,
+            _videos_params(
+                region_code, min(MAX_RESULTS_PER_PAGE, max_total), api_key, category_id
+            ),
+            region_code,
+        )
+        while pending is not None:
+            page = pending.result()
+            df = page.df.head(max_total - fetched)
+            fetched += len(df)
+
+            pending = None
+            if page.next_page_token and len(df) and fetched < max_total:
+                pending = pool.submit(
+                    _fetch_page,
+                    _videos_params(
+                        region_code,
+                        min(MAX_RESULTS_PER_PAGE, max_total - fetched),
+                        api_key,
+                        category_id,
+                        page_token=page.next_page_token,
+                    ),
+                    region_code,
+                    fetched + 1,
+                )
+
+            if len(df):
+                yield df
+
+
+def fetch_trending_news_paginated(
+    region_code: str,
+    max_total: int = MAX_TOTAL_RESULTS,
+    api_key: Optional[str] = None,
+    category_id: str = NEWS_CATEGORY_ID,
+) -> pd.DataFrame:
+    """Fetch up to ``max_total`` videos across pages, sorted by view count."""
+    pages = list(iter_trending_news_pages(region_code, max_total, api_key, category_id))
+    if not pages:
+        return pd.DataFrame()
+    return sort_by_views(apply_video_schema(pd.concat(pages, ignore_index=True)))
+
+
+def iter_trending_news_records(
+    region_code: str,
+    max_total: int = MAX_TOTAL_RESULTS,
+    api_key: Optional[str] = None,
+    category_id: str = NEWS_CATEGORY_ID,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[VideoRecord]:
+    """
+    Yield ``VideoRecord``s in chart order while each page is still downloading.
+
+    Every page is read with ``iter_content`` and its ``items`` are decoded
+    one by one as their bytes arrive (``iter_json_array``), so the first
+    records are available after the first chunk rather than the whole body,
+    and at most one item plus one chunk of the body is held at a time.
+    ``nextPageToken`` is followed until ``max_total`` videos have been
+    yielded. Rank ``n`` is the ``n``-th record; ``records_to_frame`` with a
+    matching ``start_rank`` turns any batch of them into frame rows.
+
+    Streamed pages bypass ``PAGE_VALIDATORS``: there is no complete page to
+    keep for a later ``304``. Malformed bodies raise ``requests.JSONDecodeError``
+    like the buffered path.
+    """
+    fetched = 0
+    page_token: Optional[str] = None
+    while fetched < max_total:
+        params = _videos_params(
+            region_code,
+            min(MAX_RESULTS_PER_PAGE, max_total - fetched),
+            api_key,
+            category_id,
+            page_token=page_token,
+        )
+        envelope: dict = {}
+        page_start = fetched
+        with closing(_send_videos_request(params, region_code, stream=True)) as resp:
+            resp.raise_for_status()
+            for item in iter_response_array(resp, "items", envelope, chunk_size):
+                yield decode_video(item)
+                fetched += 1
+                if fetched >= max_total:
+                    return
+        page_token = envelope.get("nextPageToken")
+        if not page_token or fetched == page_start:
+            return
+
+
+# ----------------- ASYNC CLIENT --------------------------
+
+class _AsyncResponse(NamedTuple):
+    """Fully read aiohttp response with the bits of the requests API we use."""
+
+    status_code: int
+    headers: Mapping[str, str]
+    body: bytes
+    url: str
+
+    @property
+    def content(self) -> bytes:
+        return self.body
+
+    def json(self):
+        return decode_json(self.body)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(
+                f"{self.status_code} Error for url: {redact_keys(self.url)}", response=self
+            )
+
+
+class AsyncYouTubeClient:
+    """
+    asyncio counterpart of the fetch functions above, on one aiohttp session.
+
+    Every HTTP request made through the client, whatever region or page it
+    belongs to, first takes a slot of one semaphore, so gathering hundreds of
+    coroutines keeps at most ``concurrency`` calls in flight and needs no
+    thread per request. Quota charging, key rotation, ETag revalidation,
+    retries and circuit breakers behave exactly as in ``_fetch_page``.
+    Transport errors surface as ``requests`` exceptions, so ``FETCH_ERRORS``
+    covers both paths.
+
+    Use as ``async with AsyncYouTubeClient() as client: ...``. Requires the
+    optional ``aiohttp`` package.
+    """
+
+    def __init__(self, concurrency: int = DEFAULT_ASYNC_CONCURRENCY) -> None:
+        if aiohttp is None:
+            raise RuntimeError("The async fetch path needs the 'aiohttp' package")
+        self.concurrency = max(1, concurrency)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    async def __aenter__(self) -> "AsyncYouTubeClient":
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._session = aiohttp.ClientSession(
+            headers={"Accept-Encoding": "gzip", "User-Agent": USER_AGENT},
+            timeout=aiohttp.ClientTimeout(
+                sock_connect=REQUEST_TIMEOUT[0], sock_read=REQUEST_TIMEOUT[1]
+            ),
+            connector=aiohttp.TCPConnector(limit=self.concurrency),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._session.close()
+
+    async def _get(self, url: str, params: dict, headers: dict) -> _AsyncResponse:
+        async with self._semaphore:
+            try:
+                async with self._session.get(url, params=params, headers=headers) as resp:
+                    body = await resp.read()
+                    return _AsyncResponse(resp.status, resp.headers, body, str(resp.url))
+            except asyncio.TimeoutError as exc:
+                raise requests.Timeout(str(exc) or "Request timed out") from exc
+            except aiohttp.ClientError as exc:
+                raise requests.ConnectionError(str(exc)) from exc
+
+    async def fetch_page(self, params: dict, region_code: str, start_rank: int = 1) -> Page:
+        """Async ``_fetch_page``: GET one ``videos.list`` page and normalize it."""
+        vkey = _validator_key(params)
+        previous: Optional[Page] = PAGE_VALIDATORS.get(vkey)
+        headers = {"If-None-Match": previous.etag} if previous is not None else {}
+
+        url = f"{YOUTUBE_API_URL}/videos"
+        rotation = _KeyRotation(params)
+        while True:
+            api_key = rotation.next_key()
+
+            query, key_headers = _keyed_request(params, headers, api_key)
+
+            async def send(
+                api_key: str = api_key, query: dict = query, key_headers: dict = key_headers
+            ) -> _AsyncResponse:
+                QUOTA_LEDGER.charge(VIDEOS_LIST_COST, api_key, region_code)
+                return await self._get(url, query, key_headers)
+
+            resp = await send_with_retry_async(send, url)
+            if not rotation.should_rotate(api_key, resp):
+                break
+
+        if resp.status_code == 304 and previous is not None:
+            return previous
+        resp.raise_for_status()
+        return _build_page(vkey, resp.json(), resp.headers.get("ETag"), region_code, start_rank)
+
+    async def fetch_trending_news_for_region(
+        self,
+        region_code: str,
+        max_results: int = MAX_RESULTS_PER_PAGE,
+        api_key: Optional[str] = None,
+        category_id: str = NEWS_CATEGORY_ID,
+    ) -> pd.DataFrame:
+        page = await self.fetch_page(
+            _videos_params(region_code, max_results, api_key, category_id), region_code
+        )
+        return sort_by_views(page.df)
+
+    async def fetch_trending_news_paginated(
+        self,
+        region_code: str,
+        max_total: int = MAX_TOTAL_RESULTS,
+        api_key: Optional[str] = None,
+        category_id: str = NEWS_CATEGORY_ID,
+    ) -> pd.DataFrame:
+        """Follow ``nextPageToken`` up to ``max_total`` videos; other regions use the wait."""
+        pages: List[pd.DataFrame] = []
+        fetched, token = 0, None
+        while fetched < max_total:
+            page = await self.fetch_page(
+                _videos_params(
+                    region_code,
+                    min(MAX_RESULTS_PER_PAGE, max_total - fetched),
+                    api_key,
+                    category_id,
+                    page_token=token,
+                ),
+                region_code,
+                fetched + 1,
+            )
+            df = page.df.head(max_total - fetched)
+            if not len(df):
+                break
+            pages.append(df)
+            fetched += len(df)
+            token = page.next_page_token
+            if not token:
+                break
+        if not pages:
+            return pd.DataFrame()
+        return sort_by_views(apply_video_schema(pd.concat(pages, ignore_index=True)))
+
+    async def fetch_region(
+        self,
+        region_code: str,
+        max_results: int = MAX_RESULTS_PER_PAGE,
+        api_key: Optional[str] = None,
+        category_id: str = NEWS_CATEGORY_ID,
+    ) -> pd.DataFrame:
+        """One page up to ``MAX_RESULTS_PER_PAGE`` videos, paginated beyond."""
+        if max_results <= MAX_RESULTS_PER_PAGE:
+            return await self.fetch_trending_news_for_region(
+                region_code, max_results, api_key, category_id
+            )
+        return await self.fetch_trending_news_paginated(
+            region_code, max_results, api_key, category_id
+        )
+
+
+async def fetch_trending_news_for_region_async(
+    region_code: str,
+    max_results: int = MAX_RESULTS_PER_PAGE,
+    api_key: Optional[str] = None,
+    category_id: str = NEWS_CATEGORY_ID,
+) -> pd.DataFrame:
+    """Async ``fetch_trending_news_for_region`` on a one-off client (see AsyncYouTubeClient)."""
+    async with AsyncYouTubeClient() as client:
+        return await client.fetch_trending_news_for_region(
+            region_code, max_results, api_key, category_id
+        )